@@ -28,9 +28,9 @@ class TaskParser:
         user_list_text = "\n".join(
             [
                 (
-                    f"- @{user['username']} (ID: {user['id']})"
+                    f"- @{user['username']}"
                     if user["username"]
-                    else f"- {user['first_name']} {user['last_name'] or ''} (ID: {user['id']})"
+                    else f"- {user['first_name']} {user['last_name'] or ''}"
                 )
                 for user in available_users
             ]
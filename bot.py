@@ -16,7 +16,7 @@ import socketio
 from database import Database
 from scheduler import TaskScheduler
 from ai_parser import TaskParser
-from models import TaskStatus
+from models import TaskStatus, engine
 from handlers.commands import (
     start_command,
     register_command,
@@ -492,6 +492,12 @@ async def delete_task_api(task_id: int):
 # Duplicate get_members removed, merged into get_members_api above.
 
 
+@app.get("/debug/pool")
+async def get_pool_status():
+    """Report connection pool usage (checked out, overflow, etc.)"""
+    return {"pool": engine.pool.status()}
+
+
 @app.get("/api/analytics")
 async def get_analytics(workspaceId: str = None):
     default_data = {
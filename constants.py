@@ -1,4 +1,5 @@
 import os
+import re
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -6,6 +7,19 @@ load_dotenv()
 
 DATE_FORMAT = "%Y-%m-%d %H:%M UTC"
 
+
+def format_date(dt):
+    """Render a datetime as DATE_FORMAT renders it, without strftime.
+
+    strftime re-parses the format string and consults locale machinery on
+    every call; this hand-written equivalent is several times faster on
+    the scheduler's hot path. Keep it in sync with DATE_FORMAT.
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d} UTC"
+    )
+
 AI_MODEL = "gemini-2.5-flash"
 AI_TEMPERATURE = 0.1
 AI_MIME_TYPE = "application/json"
@@ -120,7 +134,71 @@ ADD_TASK_SUCCESS = (
     "{reminder_text}\n\n"
     "Tip: Use /my_tasks to view your tasks."
 )
+# Segments of ADD_TASK_SUCCESS split at its placeholders (task_name,
+# task_code, user_list, due_date_display, reminder_text), pre-computed so
+# the hot path can "".join instead of re-parsing the format string
+ADD_TASK_SUCCESS_SEGMENTS = tuple(re.split(r"\{\w+\}", ADD_TASK_SUCCESS))
 MY_TASKS_NONE = "You have no active tasks."
+MY_TASKS_INVALID_FILTER = (
+    "Invalid filter.\n\n"
+    "Usage: /my_tasks [filter]\n\n"
+    "Filters: new, in_progress, done, all\n\n"
+    "Example: /my_tasks new\n\n"
+    "Tip: Use 'all' to see all tasks."
+)
+
+ADD_TASK_NO_USERS = (
+    "No users identified in the task.\n\n"
+    "Tap user names or use @username for registered users.\n\n"
+    "Example: /add_task {example_word} @username\n\n"
+    "Tip: Users must register with /start first."
+)
+ADD_TASK_NO_USERS_OR_DATE = (
+    "No users or due date identified in the task.\n\n"
+    "Tap user names or use @username for registered users,\n"
+    "and include a deadline like 'tomorrow at 2 PM'.\n\n"
+    "Example: /add_task {example_word} @username tomorrow 2 PM\n\n"
+    "Tip: Users must register with /start first."
+)
+
+UPDATE_STATUS_USAGE = (
+    "Update Task Status\n\n"
+    "Usage: /update_status TASK_CODE STATUS\n\n"
+    "Available statuses:\n"
+    "• new - Task is new\n"
+    "• in_progress or progress - Task is in progress\n"
+    "• done - Task is completed\n\n"
+    "Example: /update_status TK0001 in_progress"
+)
+
+VIEW_DONE_USAGE = (
+    "View Done Tasks\n\n"
+    "Usage: /view_done @username or tap on user's name\n\n"
+    "This will show all completed tasks for that user in this group."
+)
+
+DELETE_TASK_USAGE = (
+    "<b>Delete Tasks</b>\n\n"
+    "Usage: /delete_task TASK_CODE [TASK_CODE2] ...\n\n"
+    "Examples:\n"
+    "• /delete_task TK0001\n"
+    "• /delete_task TK0001 TK0002 TK0003\n"
+    "• /delete_task TK0001,TK0002\n\n"
+    "Warning: This action cannot be undone!"
+)
+
+LIST_TASKS_USAGE = (
+    "<b>List Tasks</b>\n\n"
+    "Usage: /list_tasks @username [status]\n\n"
+    "Mandatory: @username (or mention the user)\n"
+    "Optional status filters:\n"
+    "• new - Only new tasks\n"
+    "• in_progress - Only tasks in progress\n"
+    "• done - Only completed tasks\n"
+    "• all - All tasks (default)\n\n"
+    "Example: /list_tasks @john done\n\n"
+    "Tip: Admins can list tasks for any user."
+)
 
 EDIT_REMINDERS_USAGE = (
     "Your tasks and reminder settings:\n\n"
@@ -157,6 +235,12 @@ EDIT_REMINDERS_UPDATED_SINGLE = (
 EDIT_REMINDERS_UPDATED_MULTIPLE = (
     "Reminders set for: {task_name}\n\n" "Reminders: {reminder_parts} before due date."
 )
+EDIT_REMINDERS_UPDATED_SINGLE_SEGMENTS = tuple(
+    re.split(r"\{\w+\}", EDIT_REMINDERS_UPDATED_SINGLE)
+)
+EDIT_REMINDERS_UPDATED_MULTIPLE_SEGMENTS = tuple(
+    re.split(r"\{\w+\}", EDIT_REMINDERS_UPDATED_MULTIPLE)
+)
 EDIT_REMINDERS_ERROR = "Failed to update reminders. Try again."
 EDIT_REMINDERS_INVALID_NUMBER = (
     "Use a valid task code, e.g., /edit_task_reminders TK0001 ..."
@@ -176,3 +260,7 @@ REMINDER_MESSAGE = (
     "<b>Assigned to:</b> {user_mentions}\n\n"
     "This task is due in about {time_str}!"
 )
+# Segments of REMINDER_MESSAGE split at its placeholders (task_name,
+# task_code, due_date_str, user_mentions, time_str), pre-computed so the
+# scheduler can "".join instead of re-parsing the format string per send
+REMINDER_MESSAGE_SEGMENTS = tuple(re.split(r"\{\w+\}", REMINDER_MESSAGE))
@@ -1,9 +1,13 @@
 import logging
-from datetime import datetime, timezone
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from telegram import Bot
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from models import (
     SessionLocal,
     User,
@@ -16,26 +20,82 @@ from models import (
     migrate_task_status,
     migrate_projects_table,
     migrate_dashboard_schema,
+    migrate_indexes,
     TaskStatus,
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cache of lowercased username -> (telegram_id or None, expiry). Mentions
+# repeat heavily in active groups, so a short TTL turns most lookups into a
+# dict hit. add_user drops affected entries when a user record changes.
+# Misses are cached too and the key space is user-typed mention text, so
+# the dict is cleared wholesale at a size cap to stay bounded.
+_USERNAME_ID_CACHE: Dict[str, tuple] = {}
+_USERNAME_CACHE_TTL = 600  # seconds
+_USERNAME_CACHE_MAX = 4096  # entries
+
+# Hot single-row lookups, constructed once so every execution hits
+# SQLAlchemy's compiled-statement cache instead of rebuilding and
+# recompiling an identical Query object per call
+_USER_BY_USERNAME_STMT = select(User).where(
+    func.lower(User.username) == bindparam("u")
+)
+_USER_BY_TELEGRAM_ID_STMT = select(User).where(User.telegram_id == bindparam("tid"))
+
+# Cache of upper task code -> (task dict or None, expiry). Code lookups
+# repeat under bursty traffic; task writes pop the affected code so the
+# short TTL only ever serves rows that have not changed. Capped like the
+# username cache since callers feed it user-typed codes.
+_TASK_CODE_CACHE: Dict[str, tuple] = {}
+_TASK_CODE_CACHE_TTL = 30  # seconds
+_TASK_CODE_CACHE_MAX = 4096  # entries
+
+# Width of the scheduler's due window, built once instead of per tick
+_ONE_MINUTE = timedelta(minutes=1)
+
+# The only columns the reminder serializers read; loading just these keeps
+# task descriptions and other wide fields off the scheduler's wire
+_REMINDER_TASK_COLUMNS = (
+    Task.task_code,
+    Task.task_name,
+    Task.chat_id,
+    Task.due_date,
+    Task.status,
+    Task.completed,
+    Task.created_at,
+)
+_REMINDER_USER_COLUMNS = (
+    User.telegram_id,
+    User.username,
+    User.first_name,
+    User.last_name,
+    User.receive_reminders,
+)
+
 
 class Database:
     def __init__(self):
-        # Create tables
-        create_tables()
-        # Migrate user table if needed
-        migrate_user_table()
-        # Migrate task status if needed
-        migrate_task_status()
-        # Migrate projects table if needed
-        migrate_projects_table()
-        # Migrate dashboard features (Project status, Task description)
-        migrate_dashboard_schema()
-        logger.info("Database tables created and migrated")
+        # The startup DDL is all catalog introspection and ALTERs that are
+        # no-ops once the schema is in place; export RUN_DB_MIGRATIONS=0 to
+        # skip it and shave round-trips off every process launch
+        if os.getenv("RUN_DB_MIGRATIONS", "1") != "0":
+            # Create tables
+            create_tables()
+            # Migrate user table if needed
+            migrate_user_table()
+            # Migrate task status if needed
+            migrate_task_status()
+            # Migrate projects table if needed
+            migrate_projects_table()
+            # Migrate dashboard features (Project status, Task description)
+            migrate_dashboard_schema()
+            # Create hot-path indexes if needed
+            migrate_indexes()
+            logger.info("Database tables created and migrated")
+        else:
+            logger.info("Startup migrations skipped (RUN_DB_MIGRATIONS=0)")
         self.bot = None  # Will be set by the bot instance
 
     def set_bot(self, bot: Bot):
@@ -86,18 +146,53 @@ class Database:
 
     def get_user_by_username(self, username: str) -> Optional[int]:
         """Get user ID by username. Returns telegram_id if found, None otherwise."""
+        # Remove @ symbol if present
+        clean_username = username.lstrip("@").lower()
+
+        cached = _USERNAME_ID_CACHE.get(clean_username)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
         session = self.get_session()
         try:
-            # Remove @ symbol if present
-            clean_username = username.lstrip("@")
-            from sqlalchemy import func
+            user = (
+                session.execute(_USER_BY_USERNAME_STMT, {"u": clean_username})
+                .scalars()
+                .first()
+            )
+            telegram_id = user.telegram_id if user else None
+            if len(_USERNAME_ID_CACHE) >= _USERNAME_CACHE_MAX:
+                _USERNAME_ID_CACHE.clear()
+            _USERNAME_ID_CACHE[clean_username] = (
+                telegram_id,
+                time.monotonic() + _USERNAME_CACHE_TTL,
+            )
+            return telegram_id
+        finally:
+            self.close_session(session)
 
+    def get_user_by_username_full(self, username: str) -> Optional[Dict]:
+        """Get the full user row by username in one query.
+
+        Saves the get_user_by_username -> get_user_by_telegram_id
+        double round-trip in handlers that need the display name too.
+        """
+        clean_username = username.lstrip("@").lower()
+        session = self.get_session()
+        try:
             user = (
-                session.query(User)
-                .filter(func.lower(User.username) == clean_username.lower())
+                session.execute(_USER_BY_USERNAME_STMT, {"u": clean_username})
+                .scalars()
                 .first()
             )
-            return user.telegram_id if user else None
+            if not user:
+                return None
+            return {
+                "telegram_id": user.telegram_id,
+                "username": user.username,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+            }
         finally:
             self.close_session(session)
 
@@ -105,7 +200,11 @@ class Database:
         """Get user info by telegram ID. Returns user dict if found, None otherwise."""
         session = self.get_session()
         try:
-            user = session.query(User).filter_by(telegram_id=telegram_id).first()
+            user = (
+                session.execute(_USER_BY_TELEGRAM_ID_STMT, {"tid": telegram_id})
+                .scalars()
+                .first()
+            )
             if user:
                 return {
                     "telegram_id": user.telegram_id,
@@ -118,43 +217,110 @@ class Database:
         finally:
             self.close_session(session)
 
+    def get_all_users_snapshot(self) -> List[Dict]:
+        """Get every user as a lightweight dict in one column SELECT.
+
+        Meant for handlers that would otherwise run several user queries;
+        fetch the snapshot once and match against it in Python.
+        """
+        session = self.get_session()
+        try:
+            return [
+                {
+                    "telegram_id": row.telegram_id,
+                    "username": row.username,
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                }
+                for row in session.query(
+                    User.telegram_id, User.username, User.first_name, User.last_name
+                ).all()
+            ]
+        finally:
+            self.close_session(session)
+
     def get_session(self) -> Session:
         return SessionLocal()
 
     def close_session(self, session: Session):
         session.close()
 
+    @contextmanager
+    def session_scope(self):
+        """Provide a transactional scope around a series of operations.
+
+        Commits on success, rolls back on error, and always returns the
+        connection to the pool.
+        """
+        session = self.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.close_session(session)
+
     def add_user(
         self,
         user_id: int,
         username: Optional[str] = None,
         first_name: Optional[str] = None,
         last_name: Optional[str] = None,
-    ) -> User:
-        session = self.get_session()
-        try:
-            # Check if user exists by telegram_id
-            user = session.query(User).filter_by(telegram_id=user_id).first()
-            if user:
-                # Update existing user
-                user.username = username
-                user.first_name = first_name
-                user.last_name = last_name
-                session.commit()
-            else:
-                # Create new user
-                user = User(
-                    telegram_id=user_id,
-                    username=username,
-                    first_name=first_name,
-                    last_name=last_name,
-                )
-                session.add(user)
-                session.commit()
-                session.refresh(user)
-            return user
-        finally:
-            self.close_session(session)
+    ) -> None:
+        """Register or refresh a user with a single idempotent upsert.
+
+        One INSERT ... ON CONFLICT DO UPDATE replaces the old
+        SELECT-then-INSERT/UPDATE pair. A renamed user's previous
+        username may linger in the id cache until its TTL expires, same
+        as with add_users_bulk.
+        """
+        if username:
+            _USERNAME_ID_CACHE.pop(username.lower(), None)
+
+        with self.session_scope() as session:
+            stmt = pg_insert(User).values(
+                telegram_id=user_id,
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.telegram_id],
+                set_={
+                    "username": stmt.excluded.username,
+                    "first_name": stmt.excluded.first_name,
+                    "last_name": stmt.excluded.last_name,
+                },
+            )
+            session.execute(stmt)
+
+    def add_users_bulk(self, rows: List[Dict]) -> None:
+        """Upsert several users in one session/commit.
+
+        Each row is a dict with telegram_id, username, first_name and
+        last_name keys.
+        """
+        if not rows:
+            return
+        for row in rows:
+            if row["username"]:
+                _USERNAME_ID_CACHE.pop(row["username"].lower(), None)
+
+        with self.session_scope() as session:
+            # Single INSERT ... ON CONFLICT upsert for the whole batch,
+            # instead of a SELECT+INSERT/UPDATE round-trip per user
+            stmt = pg_insert(User).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.telegram_id],
+                set_={
+                    "username": stmt.excluded.username,
+                    "first_name": stmt.excluded.first_name,
+                    "last_name": stmt.excluded.last_name,
+                },
+            )
+            session.execute(stmt)
 
     def add_task(
         self,
@@ -184,8 +350,11 @@ class Database:
             session.add(task)
             session.flush()  # Flush to get the ID without committing
 
-            # Generate task code
+            # Generate task code. Drop any cached miss for it: codes are
+            # sequential, so a lookup just before creation may have cached
+            # None for exactly this code
             task.task_code = f"TK{task.id:04d}"
+            _TASK_CODE_CACHE.pop(task.task_code, None)
 
             # Add user assignments
             for user_id in assigned_user_ids:
@@ -196,8 +365,10 @@ class Database:
                 else:
                     logger.warning(f"User {user_id} not found")
 
-            # Create reminders
-            for minutes in reminder_minutes_list:
+            # Create reminders; dict.fromkeys drops duplicate offsets while
+            # keeping order, matching the unique (task_id, minutes_before)
+            # constraint
+            for minutes in dict.fromkeys(reminder_minutes_list):
                 reminder = Reminder(task=task, minutes_before=minutes)
                 session.add(reminder)
 
@@ -220,7 +391,7 @@ class Database:
                 "description": task.description,
                 "chat_id": task.chat_id,
                 "due_date": task.due_date,
-                "status": task.status.value,
+                "status": task.status,
                 "completed": task.completed,
                 "project_id": task.project_id,
                 "assigneeId": str(user_info.telegram_id) if user_info else None,
@@ -235,62 +406,68 @@ class Database:
         finally:
             self.close_session(session)
 
-    def get_user_tasks(self, user_id: int) -> List[dict]:
+    def get_user_tasks(
+        self,
+        user_id: int,
+        chat_id: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
         session = self.get_session()
         try:
             user = session.query(User).filter_by(telegram_id=user_id).first()
             if not user:
                 return []
 
-            # Get tasks assigned to this user that are not done
-            tasks = (
+            # Get tasks assigned to this user that are not done, with any
+            # chat/status filters applied in SQL rather than in Python.
+            # Reminders and assignees are eager-loaded in two batched
+            # SELECTs instead of a query per task (and per assignee).
+            query = (
                 session.query(Task)
                 .join(TaskAssignment)
+                .options(
+                    selectinload(Task.assignments).selectinload(TaskAssignment.user),
+                    selectinload(Task.reminders),
+                )
                 .filter(
                     TaskAssignment.user_id == user.telegram_id,
                     Task.status != TaskStatus.DONE,
                 )
-                .all()
             )
+            if chat_id is not None:
+                query = query.filter(Task.chat_id == chat_id)
+            if status is not None:
+                query = query.filter(Task.status == TaskStatus[status])
+            if limit is not None:
+                # Order by due date so a capped listing keeps the most
+                # urgent tasks rather than an arbitrary subset
+                query = query.order_by(Task.due_date).limit(limit)
+            tasks = query.all()
 
             # Convert to dictionaries to avoid detached session issues
             task_data = []
             for task in tasks:
-                # Get reminders for this task
-                reminders = (
-                    session.query(Reminder).filter(Reminder.task_id == task.id).all()
-                )
-                reminder_data = []
-                for reminder in reminders:
-                    reminder_data.append(
-                        {
-                            "id": reminder.id,
-                            "minutes_before": reminder.minutes_before,
-                            "sent": reminder.sent,
-                            "created_at": reminder.created_at,
-                        }
-                    )
+                reminder_data = [
+                    {
+                        "id": reminder.id,
+                        "minutes_before": reminder.minutes_before,
+                        "sent": reminder.sent,
+                        "created_at": reminder.created_at,
+                    }
+                    for reminder in task.reminders
+                ]
 
-                # Get assignees for this task
-                assignments = (
-                    session.query(TaskAssignment)
-                    .filter(TaskAssignment.task_id == task.id)
-                    .all()
-                )
-                assignee_data = []
-                for assignment in assignments:
-                    assignee_user = (
-                        session.query(User).filter_by(telegram_id=assignment.user_id).first()
-                    )
-                    if assignee_user:
-                        assignee_data.append(
-                            {
-                                "id": assignee_user.telegram_id,
-                                "username": assignee_user.username,
-                                "first_name": assignee_user.first_name,
-                                "last_name": assignee_user.last_name,
-                            }
-                        )
+                assignee_data = [
+                    {
+                        "id": assignment.user.telegram_id,
+                        "username": assignment.user.username,
+                        "first_name": assignment.user.first_name,
+                        "last_name": assignment.user.last_name,
+                    }
+                    for assignment in task.assignments
+                    if assignment.user
+                ]
 
                 task_data.append(
                     {
@@ -299,7 +476,7 @@ class Database:
                         "task_name": task.task_name,
                         "chat_id": task.chat_id,
                         "due_date": task.due_date,
-                        "status": task.status.value,
+                        "status": task.status,
                         "completed": task.completed,
                         "created_at": task.created_at,
                         "reminders": reminder_data,
@@ -310,6 +487,54 @@ class Database:
         finally:
             self.close_session(session)
 
+    def get_user_task_by_code(
+        self, user_id: int, task_code: str, chat_id: Optional[int] = None
+    ) -> Optional[dict]:
+        """Get one active task assigned to a user by its task code.
+
+        Single indexed lookup (reminders eager-loaded alongside), instead
+        of fetching the user's whole task list and scanning it in Python.
+        """
+        session = self.get_session()
+        try:
+            query = (
+                session.query(Task)
+                .join(TaskAssignment)
+                .options(selectinload(Task.reminders))
+                .filter(
+                    TaskAssignment.user_id == user_id,
+                    func.upper(Task.task_code) == task_code.upper(),
+                    Task.status != TaskStatus.DONE,
+                )
+            )
+            if chat_id is not None:
+                query = query.filter(Task.chat_id == chat_id)
+            task = query.first()
+            if not task:
+                return None
+
+            return {
+                "id": task.id,
+                "task_code": task.task_code,
+                "task_name": task.task_name,
+                "chat_id": task.chat_id,
+                "due_date": task.due_date,
+                "status": task.status,
+                "completed": task.completed,
+                "created_at": task.created_at,
+                "reminders": [
+                    {
+                        "id": reminder.id,
+                        "minutes_before": reminder.minutes_before,
+                        "sent": reminder.sent,
+                        "created_at": reminder.created_at,
+                    }
+                    for reminder in task.reminders
+                ],
+            }
+        finally:
+            self.close_session(session)
+
     def get_done_tasks_for_user_in_chat(self, user_id: int, chat_id: int) -> List[dict]:
         """Get all done tasks for a user in a specific chat"""
         session = self.get_session()
@@ -341,7 +566,7 @@ class Database:
                         "task_name": task.task_name,
                         "chat_id": task.chat_id,
                         "due_date": task.due_date,
-                        "status": task.status.value,
+                        "status": task.status,
                         "completed": task.completed,
                         "created_at": task.created_at,
                     }
@@ -353,26 +578,33 @@ class Database:
     def get_pending_reminders(self):
         session = self.get_session()
         try:
+            # yield_per streams rows from a server-side cursor in fixed
+            # batches, so a large backlog of pending reminders never sits
+            # fully materialized as ORM objects
+            task_loader = joinedload(Reminder.task)
             reminders = (
                 session.query(Reminder)
                 .join(Task)
+                .options(
+                    # Load only the columns the serializers below read, so
+                    # fat text fields never cross the wire
+                    task_loader.load_only(*_REMINDER_TASK_COLUMNS),
+                    task_loader.selectinload(Task.assignments)
+                    .joinedload(TaskAssignment.user)
+                    .load_only(*_REMINDER_USER_COLUMNS),
+                )
                 .filter(Reminder.sent == False, Task.status != TaskStatus.DONE)
-                .all()
+                .yield_per(200)
             )
 
-            # Convert to dictionaries to avoid detached session issues
+            # Convert to dictionaries to avoid detached session issues.
+            # Assigned users arrive eager-loaded above, so the loop issues
+            # no further queries no matter how many reminders are pending
             reminder_data = []
             for reminder in reminders:
-                # Get assigned users for this task
-                assigned_users = (
-                    session.query(User)
-                    .join(TaskAssignment)
-                    .filter(TaskAssignment.task_id == reminder.task_id)
-                    .all()
-                )
-
                 user_data = []
-                for user in assigned_users:
+                for assignment in reminder.task.assignments:
+                    user = assignment.user
                     user_data.append(
                         {
                             "telegram_id": user.telegram_id,
@@ -396,7 +628,7 @@ class Database:
                             "task_name": reminder.task.task_name,
                             "chat_id": reminder.task.chat_id,
                             "due_date": reminder.task.due_date,
-                            "status": reminder.task.status.value,
+                            "status": reminder.task.status,
                             "completed": reminder.task.completed,
                             "created_at": reminder.task.created_at,
                             "assigned_users": user_data,
@@ -407,6 +639,94 @@ class Database:
         finally:
             self.close_session(session)
 
+    def get_due_reminders(self, now: datetime) -> List[dict]:
+        """Get unsent reminders whose send time falls within the next minute.
+
+        The window predicate runs in SQL (due_date minus minutes_before),
+        so each tick fetches only the handful of reminders actually due
+        instead of every pending row.
+        """
+        session = self.get_session()
+        try:
+            send_at = Task.due_date - func.make_interval(
+                0, 0, 0, 0, 0, Reminder.minutes_before
+            )
+            # Assignments are narrowed to opted-in users in the eager-load
+            # itself, so muted users never cross the wire
+            task_loader = joinedload(Reminder.task)
+            reminders = (
+                session.query(Reminder)
+                .join(Task)
+                .options(
+                    task_loader.load_only(*_REMINDER_TASK_COLUMNS),
+                    task_loader.selectinload(
+                        Task.assignments.and_(
+                            TaskAssignment.user.has(User.receive_reminders == True)
+                        )
+                    )
+                    .joinedload(TaskAssignment.user)
+                    .load_only(*_REMINDER_USER_COLUMNS),
+                )
+                .filter(
+                    Reminder.sent == False,
+                    Task.status != TaskStatus.DONE,
+                    send_at <= now,
+                    send_at > now - _ONE_MINUTE,
+                )
+                .all()
+            )
+
+            reminder_data = []
+            for reminder in reminders:
+                user_data = [
+                    {
+                        "telegram_id": assignment.user.telegram_id,
+                        "username": assignment.user.username,
+                        "first_name": assignment.user.first_name,
+                        "last_name": assignment.user.last_name,
+                        "receive_reminders": assignment.user.receive_reminders,
+                    }
+                    for assignment in reminder.task.assignments
+                ]
+
+                reminder_data.append(
+                    {
+                        "id": reminder.id,
+                        "task_id": reminder.task_id,
+                        "minutes_before": reminder.minutes_before,
+                        "sent": reminder.sent,
+                        "created_at": reminder.created_at,
+                        "task": {
+                            "id": reminder.task.id,
+                            "task_code": reminder.task.task_code,
+                            "task_name": reminder.task.task_name,
+                            "chat_id": reminder.task.chat_id,
+                            "due_date": reminder.task.due_date,
+                            "status": reminder.task.status,
+                            "completed": reminder.task.completed,
+                            "created_at": reminder.task.created_at,
+                            "assigned_users": user_data,
+                        },
+                    }
+                )
+            return reminder_data
+        finally:
+            self.close_session(session)
+
+    def mark_reminders_sent(self, reminder_ids: List[int]) -> int:
+        """Mark a batch of reminders sent with one UPDATE. Returns the
+        number of rows updated."""
+        if not reminder_ids:
+            return 0
+        with self.session_scope() as session:
+            # The sent == False guard means a racing tick can't double-mark
+            # (and the row count reflects only rows actually flipped)
+            return (
+                session.query(Reminder)
+                .filter(Reminder.id.in_(reminder_ids), Reminder.sent == False)
+                .update({Reminder.sent: True}, synchronize_session=False)
+            )
+
     def mark_reminder_sent(self, reminder_id: int) -> bool:
         session = self.get_session()
         try:
@@ -439,8 +759,9 @@ class Database:
                 # Delete existing reminders
                 session.query(Reminder).filter(Reminder.task_id == task_id).delete()
 
-                # Create new reminders
-                for minutes in reminder_minutes_list:
+                # Create new reminders, dropping duplicate offsets to honor
+                # the unique (task_id, minutes_before) constraint
+                for minutes in dict.fromkeys(reminder_minutes_list):
                     reminder = Reminder(task=task, minutes_before=minutes)
                     session.add(reminder)
 
@@ -478,29 +799,70 @@ class Database:
             if "description" in kwargs:
                 task.description = kwargs["description"]
 
+            _TASK_CODE_CACHE.pop(task.task_code, None)
             session.commit()
             return True
         finally:
             self.close_session(session)
 
     def get_task_by_code(self, task_code: str) -> Optional[dict]:
-        """Get a task by its task code"""
+        """Get a task by its task code, cached for a short TTL."""
+        code = task_code.upper()
+        cached = _TASK_CODE_CACHE.get(code)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
         session = self.get_session()
         try:
-            task = session.query(Task).filter_by(task_code=task_code.upper()).first()
-            if not task:
-                return None
+            task = session.query(Task).filter_by(task_code=code).first()
+            data = (
+                {
+                    "id": task.id,
+                    "task_code": task.task_code,
+                    "task_name": task.task_name,
+                    "chat_id": task.chat_id,
+                    "due_date": task.due_date,
+                    "status": task.status,
+                    "completed": task.completed,
+                    "created_at": task.created_at,
+                }
+                if task
+                else None
+            )
+            if len(_TASK_CODE_CACHE) >= _TASK_CODE_CACHE_MAX:
+                _TASK_CODE_CACHE.clear()
+            _TASK_CODE_CACHE[code] = (
+                data,
+                time.monotonic() + _TASK_CODE_CACHE_TTL,
+            )
+            return data
+        finally:
+            self.close_session(session)
 
-            return {
-                "id": task.id,
-                "task_code": task.task_code,
-                "task_name": task.task_name,
-                "chat_id": task.chat_id,
-                "due_date": task.due_date,
-                "status": task.status.value,
-                "completed": task.completed,
-                "created_at": task.created_at,
-            }
+    def get_tasks_by_codes(self, task_codes: List[str]) -> List[dict]:
+        """Get several tasks by code in one IN (...) query."""
+        if not task_codes:
+            return []
+        session = self.get_session()
+        try:
+            tasks = (
+                session.query(Task)
+                .filter(Task.task_code.in_([code.upper() for code in task_codes]))
+                .all()
+            )
+            return [
+                {
+                    "id": task.id,
+                    "task_code": task.task_code,
+                    "task_name": task.task_name,
+                    "chat_id": task.chat_id,
+                    "due_date": task.due_date,
+                    "status": task.status,
+                    "completed": task.completed,
+                    "created_at": task.created_at,
+                }
+                for task in tasks
+            ]
         finally:
             self.close_session(session)
 
@@ -512,6 +874,8 @@ class Database:
             if not task:
                 return False
 
+            _TASK_CODE_CACHE.pop(task.task_code, None)
+
             # Delete related reminders
             session.query(Reminder).filter(Reminder.task_id == task_id).delete()
 
@@ -527,6 +891,32 @@ class Database:
         finally:
             self.close_session(session)
 
+    def delete_tasks(self, task_ids: List[int]) -> List[int]:
+        """Delete several tasks (with assignments and reminders) in one
+        transaction. Returns the ids that were actually deleted."""
+        if not task_ids:
+            return []
+        with self.session_scope() as session:
+            existing = session.query(Task.id, Task.task_code).filter(
+                Task.id.in_(task_ids)
+            ).all()
+            existing_ids = [row.id for row in existing]
+            if not existing_ids:
+                return []
+            for row in existing:
+                _TASK_CODE_CACHE.pop(row.task_code, None)
+
+            session.query(Reminder).filter(
+                Reminder.task_id.in_(existing_ids)
+            ).delete(synchronize_session=False)
+            session.query(TaskAssignment).filter(
+                TaskAssignment.task_id.in_(existing_ids)
+            ).delete(synchronize_session=False)
+            session.query(Task).filter(Task.id.in_(existing_ids)).delete(
+                synchronize_session=False
+            )
+            return existing_ids
+
     def get_projects(self, workspace_id: Optional[str] = None) -> List[dict]:
         session = self.get_session()
         try:
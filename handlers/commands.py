@@ -1,11 +1,15 @@
-from telegram import Update
+from telegram import MessageEntity, Update
 from telegram.ext import ContextTypes
-from telegram.constants import ChatType
+from telegram.constants import ChatType, ParseMode
 from datetime import datetime, timezone
+import asyncio
+import functools
 import re
+import sys
+import time
 import logging
-import html
 
+from models import TaskStatus
 from constants import (
     DATE_FORMAT,
     START_MESSAGE,
@@ -15,18 +19,24 @@ from constants import (
     ADD_TASK_NO_DESCRIPTION,
     ADD_TASK_PAST_DATE,
     ADD_TASK_AI_ERROR,
-    ADD_TASK_SUCCESS,
+    ADD_TASK_SUCCESS_SEGMENTS,
     ADD_TASK_UNEXPECTED_ERROR,
+    ADD_TASK_NO_USERS,
+    ADD_TASK_NO_USERS_OR_DATE,
     MY_TASKS_NONE,
+    MY_TASKS_INVALID_FILTER,
+    UPDATE_STATUS_USAGE,
+    VIEW_DONE_USAGE,
+    DELETE_TASK_USAGE,
+    LIST_TASKS_USAGE,
     EDIT_REMINDERS_USAGE,
     EDIT_REMINDERS_INVALID_TASK,
     EDIT_REMINDERS_NO_SETTING,
     EDIT_REMINDERS_NEGATIVE_TIME,
-    EDIT_REMINDERS_NO_TIMES,
     EDIT_REMINDERS_INVALID_TIMES,
     EDIT_REMINDERS_DISABLED,
-    EDIT_REMINDERS_UPDATED_SINGLE,
-    EDIT_REMINDERS_UPDATED_MULTIPLE,
+    EDIT_REMINDERS_UPDATED_SINGLE_SEGMENTS,
+    EDIT_REMINDERS_UPDATED_MULTIPLE_SEGMENTS,
     EDIT_REMINDERS_ERROR,
     EDIT_REMINDERS_INVALID_NUMBER,
     EDIT_REMINDERS_UPDATE_ERROR,
@@ -37,17 +47,199 @@ from constants import (
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables for reminder-minute labels, so the handlers don't rebuild
+# the same if/elif chains on every command invocation
+_UTC = timezone.utc
+
+_REMINDER_LABELS = {60: TIME_1_HOUR, 30: TIME_30_MINUTES}
+_REMINDER_SHORT = {60: "1h"}
+
+# Status keyword tables shared by the task-listing/updating handlers
+_MY_TASKS_FILTERS = frozenset({"new", "in_progress", "done", "all"})
+_STATUS_NAMES = {"NEW": "New", "IN_PROGRESS": "In Progress", "DONE": "Done"}
+_STATUS_MAP = {
+    "new": TaskStatus.NEW,
+    "in_progress": TaskStatus.IN_PROGRESS,
+    "progress": TaskStatus.IN_PROGRESS,
+    "done": TaskStatus.DONE,
+    "complete": TaskStatus.DONE,
+    "completed": TaskStatus.DONE,
+}
+
+# Longest task description forwarded to the AI parser
+_MAX_TASK_DESCRIPTION_LEN = 1000
+
+# Finds task-code-shaped tokens anywhere in the argument string, so
+# comma/space separation and stray punctuation need no extra handling
+_CODE_FINDER = re.compile(r"[A-Za-z]{2}\d+")
+
+# Argument shapes validated up front, compiled once at import. Codes are
+# TK + zero-padded id, so four digits minimum but more once ids grow
+_TASK_CODE_RE = re.compile(r"^TK\d{4,}$")
+_REMINDER_LIST_RE = re.compile(r"^\d+(?:\s*,\s*\d+)*$")
+# Telegram usernames: 5-32 word characters, optionally prefixed with @
+_USERNAME_RE = re.compile(r"^@?([A-Za-z0-9_]{5,32})$")
+
+# Quick check for date-like content, used to skip the AI call outright for
+# messages that clearly have no assignees and no deadline
+_DATE_HINT_RE = re.compile(
+    r"\b(\d{1,2}[/-]\d{1,2}|today|tonight|tomorrow|monday|tuesday|wednesday"
+    r"|thursday|friday|saturday|sunday|next\s+week"
+    r"|\d+\s*(?:h|hr|hour|min|minute|day|week)s?)\b",
+    re.IGNORECASE,
+)
 
-async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE, database):
-    user = update.effective_user
-    args = context.args
+# Cache of (chat_id, user_id) -> (member status, expiry). Admin status
+# changes rarely, so a short TTL saves a Bot API round-trip on every
+# admin-only command.
+_ADMIN_STATUS_CACHE: dict = {}
+
+# Cache of chat_id -> (admin list, expiry); the admin set of a group
+# changes rarely but is consulted on every /add_task mention
+_CHAT_ADMINS_CACHE: dict = {}
+
+
+# Users already upserted by this process, keyed by telegram id with the
+# username we last stored. Skips the per-command add_user round-trip for
+# users who are already registered and unchanged.
+_SEEN_USERNAMES: dict = {}
+_SEEN_USERS_MAX = 100_000
+
+
+# Single-pass HTML escaping: str.translate is one C-level pass versus the
+# four str.replace calls inside html.escape
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}
+)
+
+
+def _format_reminder_list(minutes_list) -> str:
+    """Comma-joined labels for a reminder list, e.g. "1 hour, 30 minutes".
+
+    Shared by /add_task and /edit_task_reminders so the label wording
+    cannot drift between the two.
+    """
+    return ", ".join(
+        _REMINDER_LABELS.get(m, f"{m} minutes") for m in sorted(minutes_list)
+    )
 
+
+def _esc(s: str) -> str:
+    return s.translate(_HTML_ESCAPE_TABLE)
+
+
+def _normalize_username(s: str) -> str:
+    """Strip the optional @ and lowercase, interning the result.
+
+    The same handles recur across mentions in an active group, so
+    interning lets later dict lookups compare by pointer.
+    """
+    return sys.intern(s.lstrip("@").lower())
+
+
+def _extract_mentions(message):
+    """Walk a message's mention entities once.
+
+    Returns (text-mention User objects, lowercased @usernames). Uses
+    parse_entities so the library does the UTF-16 offset decoding once
+    per message instead of one manual slice per entity.
+    """
+    text_mention_users = []
+    mention_usernames = set()
+    if not message.text:
+        return text_mention_users, mention_usernames
+    parsed = message.parse_entities(
+        types=[MessageEntity.TEXT_MENTION, MessageEntity.MENTION]
+    )
+    for entity, entity_text in parsed.items():
+        if entity.type == MessageEntity.TEXT_MENTION and entity.user:
+            text_mention_users.append(entity.user)
+        elif entity.type == MessageEntity.MENTION:
+            mention_usernames.add(_normalize_username(entity_text))
+    return text_mention_users, mention_usernames
+
+
+def _log_notice_failure(task):
+    """Done-callback for background reply tasks so failures aren't silent."""
+    if not task.cancelled() and task.exception():
+        logger.error(f"Error sending notice message: {task.exception()}")
+
+
+def _register_user(database, user):
+    """Upsert a Telegram user, skipping the DB call on a cache hit."""
+    if (
+        user.id in _SEEN_USERNAMES
+        and _SEEN_USERNAMES[user.id] == user.username
+    ):
+        return
     database.add_user(
         user_id=user.id,
         username=user.username,
         first_name=user.first_name,
         last_name=user.last_name,
     )
+    if len(_SEEN_USERNAMES) >= _SEEN_USERS_MAX:
+        _SEEN_USERNAMES.clear()
+    _SEEN_USERNAMES[user.id] = user.username
+
+
+async def _get_chat_administrators(chat, ttl: float = 60):
+    """Get a chat's administrators, cached for `ttl` seconds."""
+    now = time.monotonic()
+    cached = _CHAT_ADMINS_CACHE.get(chat.id)
+    if cached and cached[1] > now:
+        return cached[0]
+    admins = await chat.get_administrators()
+    _CHAT_ADMINS_CACHE[chat.id] = (admins, now + ttl)
+    return admins
+
+
+async def _get_member_status(chat, user_id: int, ttl: float = 300) -> str:
+    """Get a user's chat member status, cached for `ttl` seconds."""
+    key = (chat.id, user_id)
+    now = time.monotonic()
+    cached = _ADMIN_STATUS_CACHE.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+    member = await chat.get_member(user_id)
+    _ADMIN_STATUS_CACHE[key] = (member.status, now + ttl)
+    return member.status
+
+
+def admin_only(denied_message: str):
+    """Reject non-group chats and non-admin callers before the handler runs.
+
+    The member-status lookup goes through _get_member_status, so repeat
+    invocations within the cache TTL cost a dict hit, not a Bot API call.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(
+            update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs
+        ):
+            chat = update.effective_chat
+            if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
+                await update.message.reply_text(
+                    "⚠️ This command only works in group chats."
+                )
+                return
+            status = await _get_member_status(chat, update.effective_user.id)
+            if status not in ["creator", "administrator"]:
+                await update.message.reply_text(denied_message)
+                return
+            return await func(update, context, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE, database):
+    user = update.effective_user
+    args = context.args
+
+    await asyncio.to_thread(_register_user, database, user)
 
     if args and args[0].startswith("join_"):
         workspace_id = args[0].replace("join_", "")
@@ -59,8 +251,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE, data
     else:
         welcome_message = START_MESSAGE.format(user_first_name=user.first_name)
 
-    await update.message.reply_text(welcome_message, parse_mode="HTML")
-    logger.info(f"User {user.id} ({user.username}) registered via /start (args={args})")
+    await update.message.reply_text(welcome_message, parse_mode=ParseMode.HTML)
+    logger.info("User %s (%s) registered via /start (args=%s)", user.id, user.username, args)
 
 
 async def register_command(
@@ -73,8 +265,8 @@ async def register_command(
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
 
-    await update.message.reply_text(HELP_MESSAGE, parse_mode="HTML")
-    logger.info(f"User {user.id} ({user.username}) requested help")
+    await update.message.reply_text(HELP_MESSAGE, parse_mode=ParseMode.HTML)
+    logger.info("User %s (%s) requested help", user.id, user.username)
 
 
 async def add_task_command(
@@ -84,47 +276,57 @@ async def add_task_command(
     chat = update.effective_chat
 
     # Register the user if not already registered
-    database.add_user(
-        user_id=user.id,
-        username=user.username,
-        first_name=user.first_name,
-        last_name=user.last_name,
-    )
+    await asyncio.to_thread(_register_user, database, user)
 
     if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
         await update.message.reply_text(GROUP_ONLY_MESSAGE)
         return
 
-    member = await chat.get_member(user.id)
-    if member.status not in ["creator", "administrator"]:
+    status = await _get_member_status(chat, user.id)
+    if status not in ["creator", "administrator"]:
         await update.message.reply_text(ADD_TASK_ADMIN_ONLY)
         return
 
     if not context.args:
-        await update.message.reply_text(ADD_TASK_NO_DESCRIPTION, parse_mode="HTML")
+        await update.message.reply_text(ADD_TASK_NO_DESCRIPTION)
         return
 
     try:
         task_description = " ".join(context.args)
+        # Bound the AI-parser input; its cost grows with prompt length
+        if len(task_description) > _MAX_TASK_DESCRIPTION_LEN:
+            task_description = task_description[:_MAX_TASK_DESCRIPTION_LEN]
+
+        # Cheap pre-scan: a usable task needs at least a mention or a
+        # date-like hint. Bailing out here skips the AI round-trip (the
+        # largest latency source in this handler) for obvious misfires.
+        entities = update.message.entities or ()
+        has_mention = any(
+            entity.type in ("mention", "text_mention") for entity in entities
+        )
+        if (
+            not has_mention
+            and "@" not in task_description
+            and not _DATE_HINT_RE.search(task_description)
+        ):
+            await update.message.reply_text(
+                ADD_TASK_NO_USERS_OR_DATE.format(
+                    example_word=task_description.split()[0]
+                ),
+            )
+            return
 
-        session = database.get_session()
-        try:
-            from models import User
-
-            available_users = [
-                {
-                    "id": u.telegram_id,
-                    "username": u.username,
-                    "first_name": u.first_name,
-                    "last_name": u.last_name,
-                }
-                for u in session.query(User).all()
-            ]
-        finally:
-            session.close()
+        # One snapshot of the user table for the whole handler - reused for
+        # the AI prompt, username/display-name matching and the final
+        # display list, instead of a query per lookup
+        users_snapshot = await asyncio.to_thread(database.get_all_users_snapshot)
+        users_by_id = {u["telegram_id"]: u for u in users_snapshot}
+        users_by_username = {
+            u["username"].lower(): u for u in users_snapshot if u["username"]
+        }
 
         parsed_data = ai_parser.parse_task_description(
-            task_description, available_users
+            task_description, users_snapshot
         )
 
         task_name = parsed_data["task_name"]
@@ -133,9 +335,14 @@ async def add_task_command(
         confidence = parsed_data["confidence"]
         reminder_minutes_list = parsed_data.get("reminder_minutes_list", [30])
 
-        due_date = datetime.strptime(due_date_str, "%Y-%m-%d %H:%M").replace(
-            tzinfo=timezone.utc
-        )
+        # The AI parser always returns "YYYY-MM-DD HH:MM"; fromisoformat is
+        # several times faster than strptime for this fixed shape. Fall
+        # back to strptime should the model ever return a variant shape
+        try:
+            due_date = datetime.fromisoformat(due_date_str.replace(" ", "T"))
+        except ValueError:
+            due_date = datetime.strptime(due_date_str, "%Y-%m-%d %H:%M")
+        due_date = due_date.replace(tzinfo=_UTC)
 
         if due_date <= datetime.now(timezone.utc):
             await update.message.reply_text(
@@ -145,30 +352,27 @@ async def add_task_command(
 
         # Collect mentioned user IDs from text mentions and entities
         mentioned_user_ids = set()
-        mentioned_usernames_from_entities = set()  # @username from entities
+        # Users to upsert, keyed by telegram id; written once at the end of
+        # mention resolution instead of a round-trip per mention
+        pending_user_rows = {}
 
         # Process both text mentions and @username mentions from entities
-        if update.message.entities:
-            for entity in update.message.entities:
-                if entity.type == "text_mention" and entity.user:
-                    # This is a user mentioned by tapping their name (not @username)
-                    mentioned_user = entity.user
-                    mentioned_user_ids.add(mentioned_user.id)
-
-                    # Register/update this user in database (they don't need to /start first)
-                    database.add_user(
-                        user_id=mentioned_user.id,
-                        username=mentioned_user.username,
-                        first_name=mentioned_user.first_name,
-                        last_name=mentioned_user.last_name,
-                    )
-                elif entity.type == "mention":
-                    # This is @username mention - extract the username
-                    username_text = update.message.text[
-                        entity.offset : entity.offset + entity.length
-                    ]
-                    clean_username = username_text.lstrip("@")
-                    mentioned_usernames_from_entities.add(clean_username)
+        text_mention_users, mentioned_usernames_from_entities = _extract_mentions(
+            update.message
+        )
+        for mentioned_user in text_mention_users:
+            # Users mentioned by tapping their name (not @username)
+            mentioned_user_ids.add(mentioned_user.id)
+
+            # Register/update this user (batched; they don't need to /start first)
+            row = {
+                "telegram_id": mentioned_user.id,
+                "username": mentioned_user.username,
+                "first_name": mentioned_user.first_name,
+                "last_name": mentioned_user.last_name,
+            }
+            pending_user_rows[mentioned_user.id] = row
+            users_by_id[mentioned_user.id] = row
 
         # Merge AI-parsed usernames with entity-detected @usernames
         all_usernames = set(usernames) | mentioned_usernames_from_entities
@@ -176,114 +380,130 @@ async def add_task_command(
         # Process AI-parsed usernames and @mentions
         if not all_usernames and not mentioned_user_ids:
             await update.message.reply_text(
-                "No users identified in the task.\n\n"
-                "Tap user names or use @username for registered users.\n\n"
-                f"Example: /add_task {task_description.split()[0]} @username\n\n"
-                "Tip: Users must register with /start first.",
-                parse_mode="HTML",
+                ADD_TASK_NO_USERS.format(example_word=task_description.split()[0]),
             )
             return
 
-        # Try to get user IDs from group chat members for @username mentions
+        # Resolve handles against the preloaded snapshot first. The chat
+        # administrators are only fetched (one cached Bot API call) when
+        # some handle is still unknown, so the common all-registered case
+        # never touches Telegram at all
         unresolved_usernames = []
+        unresolved_handles = []
         for username in all_usernames:
-            clean_username = username.lstrip("@")
-            user_found = False
+            # One regex pass validates the handle shape and strips the
+            # optional @; anything that cannot be a username (display
+            # names with spaces, etc.) goes straight to display matching
+            handle_match = _USERNAME_RE.match(username)
+            if handle_match is None:
+                unresolved_usernames.append(username)
+                continue
+            clean_username = _normalize_username(handle_match.group(1))
+
+            user_row = users_by_username.get(clean_username)
+            if user_row:
+                mentioned_user_ids.add(user_row["telegram_id"])
+            else:
+                unresolved_handles.append((username, clean_username))
 
-            # Try to get chat administrators and members to find the user
+        if unresolved_handles:
+            admin_by_username = {}
             try:
-                # Get chat administrators first (most likely to be mentioned)
-                admins = await chat.get_administrators()
-                for admin in admins:
-                    if (
-                        admin.user.username
-                        and admin.user.username.lower() == clean_username.lower()
-                    ):
-                        mentioned_user_ids.add(admin.user.id)
-                        # Register/update this user
-                        database.add_user(
-                            user_id=admin.user.id,
-                            username=admin.user.username,
-                            first_name=admin.user.first_name,
-                            last_name=admin.user.last_name,
-                        )
-                        user_found = True
-                        break
+                admins = await _get_chat_administrators(chat)
+                admin_by_username = {
+                    admin.user.username.lower(): admin.user
+                    for admin in admins
+                    if admin.user.username
+                }
             except Exception as e:
-                logger.debug(f"Could not fetch chat administrators: {e}")
-
-            if not user_found:
-                # Fallback: check our database
-                session = database.get_session()
-                try:
-                    from models import User
-
-                    user_obj = (
-                        session.query(User).filter_by(username=clean_username).first()
-                    )
-                    if user_obj:
-                        mentioned_user_ids.add(user_obj.telegram_id)
-                        user_found = True
-                finally:
-                    session.close()
+                logger.debug("Could not fetch chat administrators: %s", e)
+
+            for username, clean_username in unresolved_handles:
+                admin_user = admin_by_username.get(clean_username)
+                if admin_user:
+                    mentioned_user_ids.add(admin_user.id)
+                    # Register/update this user (batched below)
+                    row = {
+                        "telegram_id": admin_user.id,
+                        "username": admin_user.username,
+                        "first_name": admin_user.first_name,
+                        "last_name": admin_user.last_name,
+                    }
+                    pending_user_rows[admin_user.id] = row
+                    users_by_id[admin_user.id] = row
+                else:
+                    unresolved_usernames.append(username)
 
-            if not user_found:
-                unresolved_usernames.append(username)
+        if pending_user_rows:
+            await asyncio.to_thread(
+                database.add_users_bulk, list(pending_user_rows.values())
+            )
 
         # Resolve any remaining usernames by display name matching
         unregistered_usernames = []
         if unresolved_usernames:
-            session = database.get_session()
-            try:
-                from models import User
-
-                for username in unresolved_usernames:
-                    user_obj = None
-                    clean_username = username.lstrip("@")
-
-                    # Try to match by display name (first_name + last_name)
-                    for u in session.query(User).all():
-                        display_name = f"{u.first_name} {u.last_name or ''}".strip()
-                        if display_name.lower() == clean_username.lower():
-                            user_obj = u
-                            break
-
-                    if not user_obj:
-                        # Try to match by first name only
-                        user_obj = (
-                            session.query(User)
-                            .filter(User.first_name.ilike(clean_username))
-                            .first()
-                        )
-
-                    if not user_obj:
-                        # Try to match by last name only
-                        user_obj = (
-                            session.query(User)
-                            .filter(User.last_name.ilike(clean_username))
-                            .first()
-                        )
-
-                    if user_obj:
-                        mentioned_user_ids.add(user_obj.telegram_id)
-                    else:
-                        unregistered_usernames.append(username)
-            finally:
-                session.close()
+            # Index the snapshot once; each unresolved name then costs three
+            # dict lookups instead of a scan over every user
+            users_by_display = {}
+            users_by_first = {}
+            users_by_last = {}
+            for u in users_snapshot:
+                display_name = f"{u['first_name']} {u['last_name'] or ''}".strip()
+                users_by_display.setdefault(display_name.lower(), u)
+                if u["first_name"]:
+                    users_by_first.setdefault(u["first_name"].lower(), u)
+                if u["last_name"]:
+                    users_by_last.setdefault(u["last_name"].lower(), u)
+
+            for username in unresolved_usernames:
+                clean_lower = _normalize_username(username)
+
+                # Match by display name, then first name, then last name
+                user_row = (
+                    users_by_display.get(clean_lower)
+                    or users_by_first.get(clean_lower)
+                    or users_by_last.get(clean_lower)
+                )
+
+                if user_row:
+                    mentioned_user_ids.add(user_row["telegram_id"])
+                else:
+                    unregistered_usernames.append(username)
 
         # Convert set to list for database operations
         assigned_user_ids = list(mentioned_user_ids)
 
         # Notify about unregistered @username mentions
         if unregistered_usernames:
-            mentions = " ".join([f"@{username}" for username in unregistered_usernames])
-            await update.message.reply_text(
-                f"Registration required: Could not find {mentions}.\n\n"
-                f"To assign tasks, users must register with /start in private.\n\n"
-                f"Tip: Tap names or use @username for registered users.",
-                parse_mode="HTML",
-                reply_to_message_id=update.message.message_id,
+            # Built once and shared by both reply branches below
+            mentions = " ".join("@" + username for username in unregistered_usernames)
+            if not assigned_user_ids:
+                # No one could be resolved at all - send a single combined
+                # message instead of two separate Bot API calls
+                await update.message.reply_text(
+                    f"Registration required: Could not find {mentions}.\n\n"
+                    f"All mentioned users need to register first.\n\n"
+                    f"To assign tasks:\n"
+                    f"• Tap user names in the group to mention them\n"
+                    f"• Or use @username for users who have already used /start\n\n"
+                    f"Tip: Users must register with /start in private.",
+                    reply_to_message_id=update.message.message_id,
+                )
+                return
+            # Some users resolved, some not: send the warning as a task so
+            # it overlaps with the DB write and the success reply instead of
+            # serializing two Bot API round-trips
+            unregistered_notice = asyncio.create_task(
+                update.message.reply_text(
+                    f"Registration required: Could not find {mentions}.\n\n"
+                    f"To assign tasks, users must register with /start in private.\n\n"
+                    f"Tip: Tap names or use @username for registered users.",
+                    reply_to_message_id=update.message.message_id,
+                )
             )
+            unregistered_notice.add_done_callback(_log_notice_failure)
+        else:
+            unregistered_notice = None
 
         if not assigned_user_ids:
             await update.message.reply_text(
@@ -293,11 +513,11 @@ async def add_task_command(
                 f"• Or use @username for users who have already used /start\n\n"
                 f"Example: Tap on someone's name or use /add_task {task_description.split()[0]} @username\n\n"
                 f"Tip: Users must register with /start first.",
-                parse_mode="HTML",
             )
             return
 
-        task = database.add_task(
+        task = await asyncio.to_thread(
+            database.add_task,
             task_name=task_name,
             chat_id=chat.id,
             due_date=due_date,
@@ -310,70 +530,64 @@ async def add_task_command(
             await update.message.reply_text(ADD_TASK_UNEXPECTED_ERROR)
             return
 
-        # Build user list for display using user IDs
+        # Build user list for display from the snapshot
         user_display_names = []
-        session = database.get_session()
-        try:
-            from models import User
-
-            for user_id in assigned_user_ids:
-                user_obj = session.query(User).filter_by(telegram_id=user_id).first()
-                if user_obj:
-                    if user_obj.username:
-                        user_display_names.append(f"@{user_obj.username}")
-                    else:
-                        display_name = f"{user_obj.first_name}"
-                        if user_obj.last_name:
-                            display_name += f" {user_obj.last_name}"
-                        user_display_names.append(display_name)
-        finally:
-            session.close()
+        for user_id in assigned_user_ids:
+            user_row = users_by_id.get(user_id)
+            if user_row:
+                if user_row["username"]:
+                    user_display_names.append("@" + user_row["username"])
+                elif user_row["last_name"]:
+                    user_display_names.append(
+                        user_row["first_name"] + " " + user_row["last_name"]
+                    )
+                else:
+                    user_display_names.append(user_row["first_name"])
 
         user_list = ", ".join(user_display_names)
 
         # Escape HTML characters in user_list
-        import html
-
-        user_list = html.escape(user_list)
+        user_list = _esc(user_list)
 
         due_date_display = due_date.strftime(DATE_FORMAT)
 
         if reminder_minutes_list:
+            labels = _format_reminder_list(reminder_minutes_list)
             if len(reminder_minutes_list) == 1:
-                minutes = reminder_minutes_list[0]
-                if minutes == 60:
-                    reminder_text = "Reminder will be sent 1 hour before the deadline."
-                elif minutes == 30:
-                    reminder_text = (
-                        "Reminder will be sent 30 minutes before the deadline."
-                    )
-                else:
-                    reminder_text = (
-                        f"Reminder will be sent {minutes} minutes before the deadline."
-                    )
+                reminder_text = f"Reminder will be sent {labels} before the deadline."
             else:
-                reminder_parts = []
-                for minutes in sorted(reminder_minutes_list):
-                    if minutes == 60:
-                        reminder_parts.append(TIME_1_HOUR)
-                    elif minutes == 30:
-                        reminder_parts.append(TIME_30_MINUTES)
-                    else:
-                        reminder_parts.append(f"{minutes} minutes")
-                reminder_text = f"Reminders will be sent {', '.join(reminder_parts)} before the deadline."
+                reminder_text = (
+                    f"Reminders will be sent {labels} before the deadline."
+                )
         else:
             reminder_text = "No reminders will be sent for this task."
 
-        response = ADD_TASK_SUCCESS.format(
-            task_name=html.escape(task_name),
-            task_code=task["task_code"],
-            user_list=user_list,
-            due_date_display=due_date_display,
-            reminder_text=reminder_text,
+        seg = ADD_TASK_SUCCESS_SEGMENTS
+        response = "".join(
+            (
+                seg[0],
+                _esc(task_name),
+                seg[1],
+                task["task_code"],
+                seg[2],
+                user_list,
+                seg[3],
+                due_date_display,
+                seg[4],
+                reminder_text,
+                seg[5],
+            )
         )
 
         try:
-            await update.message.reply_text(response, parse_mode="HTML")
+            if unregistered_notice is not None:
+                # Both replies are independent; let the round-trips overlap
+                await asyncio.gather(
+                    unregistered_notice,
+                    update.message.reply_text(response, parse_mode=ParseMode.HTML),
+                )
+            else:
+                await update.message.reply_text(response, parse_mode=ParseMode.HTML)
         except Exception as msg_error:
             logger.error(f"Error sending success message: {msg_error}", exc_info=True)
             await update.message.reply_text("Task created successfully!")
@@ -382,14 +596,18 @@ async def add_task_command(
         try:
             task_id = task.get("id", "unknown") if task else "unknown"
             logger.info(
-                f"AI-parsed task created: {task_name} (ID: {task_id}) by user {user.id} (confidence: {confidence:.2f})"
+                "AI-parsed task created: %s (ID: %s) by user %s (confidence: %.2f)",
+                task_name,
+                task_id,
+                user.id,
+                confidence,
             )
         except Exception as log_error:
             logger.error(f"Error in logging: {log_error}", exc_info=True)
 
     except ValueError as e:
         await update.message.reply_text(
-            ADD_TASK_AI_ERROR.format(error=str(e)), parse_mode="HTML"
+            ADD_TASK_AI_ERROR.format(error=str(e))
         )
     except Exception as e:
         logger.error(f"Error creating AI-parsed task: {e}", exc_info=True)
@@ -409,33 +627,27 @@ async def my_tasks_command(
 
     if context.args:
         filter_arg = context.args[0].lower()
-        if filter_arg in ["new", "in_progress", "done", "all"]:
+        if filter_arg in _MY_TASKS_FILTERS:
             if filter_arg != "all":
                 status_filter = filter_arg.upper()
             filter_text = f" ({filter_arg.replace('_', ' ').title()})"
         else:
-            await update.message.reply_text(
-                "Invalid filter.\n\n"
-                "Usage: /my_tasks [filter]\n\n"
-                "Filters: new, in_progress, done, all\n\n"
-                "Example: /my_tasks new\n\n"
-                "Tip: Use 'all' to see all tasks.",
-                parse_mode="HTML",
-            )
+            await update.message.reply_text(MY_TASKS_INVALID_FILTER)
             return
 
-    tasks = database.get_user_tasks(user.id)
-
-    # Filter by group if in a group chat
-    if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        tasks = [task for task in tasks if task["chat_id"] == chat.id]
-
-    # Apply status filter
-    if status_filter:
-        tasks = [task for task in tasks if task.get("status") == status_filter]
+    # Both filters are applied in the SQL WHERE clause; the cap keeps the
+    # response bounded (Telegram truncates at 4096 chars anyway)
+    tasks = await asyncio.to_thread(
+        database.get_user_tasks,
+        user.id,
+        chat_id=(
+            chat.id if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP] else None
+        ),
+        status=status_filter,
+        limit=50,
+    )
 
-    # Status name mapping
-    status_names = {"NEW": "New", "IN_PROGRESS": "In Progress", "DONE": "Done"}
+    status_names = _STATUS_NAMES
 
     if not tasks:
         if status_filter:
@@ -447,34 +659,39 @@ async def my_tasks_command(
             await update.message.reply_text(MY_TASKS_NONE)
         return
 
-    response = f"<b>Your Tasks{filter_text}:</b>\n\n"
+    # Build the response in a list and join once - repeated += on a string
+    # copies the whole buffer every iteration
+    parts = [f"<b>Your Tasks{filter_text}:</b>\n\n"]
+
+    # Loop invariants: one clock read and one tz lookup for all tasks
+    now = datetime.now(_UTC)
 
     for task in tasks:
         due_date_str = task["due_date"].strftime(DATE_FORMAT)
 
         if task["due_date"].tzinfo is None:
-            due_date_utc = task["due_date"].replace(tzinfo=timezone.utc)
+            due_date_utc = task["due_date"].replace(tzinfo=_UTC)
         else:
             due_date_utc = task["due_date"]
 
-        time_remaining = due_date_utc - datetime.now(timezone.utc)
-        days = time_remaining.days
-        hours = time_remaining.seconds // 3600
+        total = int((due_date_utc - now).total_seconds())
+        days, rem = divmod(total, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes = rem // 60
 
         if days > 0:
             time_str = f"{days} day(s) {hours} hour(s)"
         elif hours > 0:
             time_str = f"{hours} hour(s)"
         else:
-            minutes = time_remaining.seconds // 60
             time_str = f"{minutes} minute(s)"
 
-        # Get status display
-        task_status = task.get("status", "NEW")
-        status_display = status_names.get(task_status, "New")
+        # Get status display; the DAO always populates these keys, so
+        # plain indexing beats .get() with a default
+        status_display = status_names.get(task["status"], "New")
 
         # Get assignees display
-        assignees = task.get("assignees", [])
+        assignees = task["assignees"]
         if assignees:
             assignee_names = []
             for assignee in assignees:
@@ -487,7 +704,7 @@ async def my_tasks_command(
         else:
             assignees_str = "None"
 
-        response += (
+        parts.append(
             f"<b>{task['task_code']}</b> - {task['task_name']}\n"
             f"   Status: <b>{status_display}</b>\n"
             f"   Assigned to: {assignees_str}\n"
@@ -497,11 +714,16 @@ async def my_tasks_command(
 
     # Add filter hint if no filter is applied
     if not status_filter:
-        response += "\nTip: Use /my_tasks [new|in_progress|done] to filter tasks"
+        parts.append("\nTip: Use /my_tasks [new|in_progress|done] to filter tasks")
 
-    await update.message.reply_text(response, parse_mode="HTML")
+    response = "".join(parts)
+
+    await update.message.reply_text(response, parse_mode=ParseMode.HTML)
     logger.info(
-        f"User {user.id} ({user.username}) viewed their tasks (filter: {status_filter or 'all'})"
+        "User %s (%s) viewed their tasks (filter: %s)",
+        user.id,
+        user.username,
+        status_filter or "all",
     )
 
 
@@ -511,29 +733,29 @@ async def edit_task_reminders_command(
     user = update.effective_user
     chat = update.effective_chat
 
-    tasks = database.get_user_tasks(user.id)
-
-    # Filter by group if in a group chat
-    if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        tasks = [task for task in tasks if task["chat_id"] == chat.id]
+    if not context.args:
+        tasks = await asyncio.to_thread(
+            database.get_user_tasks,
+            user.id,
+            chat_id=(
+                chat.id
+                if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]
+                else None
+            ),
+        )
 
-    if not tasks:
-        await update.message.reply_text(MY_TASKS_NONE)
-        return
+        if not tasks:
+            await update.message.reply_text(MY_TASKS_NONE)
+            return
 
-    if not context.args:
         task_lines = []
         for task in tasks:
             reminders_str = "disabled"
             if task["reminders"]:
-                reminder_parts = []
-                for r in task["reminders"]:
-                    minutes = r["minutes_before"]
-                    if minutes == 60:
-                        reminder_parts.append("1h")
-                    else:
-                        reminder_parts.append(f"{minutes}m")
-                reminders_str = ", ".join(reminder_parts)
+                reminders_str = ", ".join(
+                    _REMINDER_SHORT.get(r["minutes_before"], f"{r['minutes_before']}m")
+                    for r in task["reminders"]
+                )
 
             task_lines.append(
                 f"<b>{task['task_code']}</b> - {task['task_name']}\n"
@@ -542,17 +764,25 @@ async def edit_task_reminders_command(
             )
 
         response = EDIT_REMINDERS_USAGE.format(task_list="".join(task_lines))
-        await update.message.reply_text(response, parse_mode="HTML")
+        await update.message.reply_text(response, parse_mode=ParseMode.HTML)
         return
 
     try:
         task_code = context.args[0].upper()
 
-        task = None
-        for t in tasks:
-            if t["task_code"].upper() == task_code:
-                task = t
-                break
+        # A code was supplied, so look up that one task directly instead of
+        # fetching the user's whole task list; the chat scope is part of
+        # the query in group chats
+        task = await asyncio.to_thread(
+            database.get_user_task_by_code,
+            user.id,
+            task_code,
+            chat_id=(
+                chat.id
+                if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]
+                else None
+            ),
+        )
 
         if not task:
             await update.message.reply_text(EDIT_REMINDERS_INVALID_TASK)
@@ -565,74 +795,55 @@ async def edit_task_reminders_command(
         reminder_setting = context.args[1].lower()
 
         if reminder_setting == "off":
-            success = database.update_task_reminders(
+            success = await asyncio.to_thread(
+                database.update_task_reminders,
                 task["id"], reminder_minutes_list=[]
             )
             if success:
                 await update.message.reply_text(
                     f"Reminders disabled for task: {task['task_name']}\n\n"
                     f"No reminders will be sent for this task.",
-                    parse_mode="HTML",
                 )
-                logger.info(f"User {user.id} disabled reminders for task {task['id']}")
+                logger.info(
+                    "User %s disabled reminders for task %s", user.id, task["id"]
+                )
             else:
                 await update.message.reply_text("Error updating task reminders.")
         else:
-            try:
-                reminder_times_str = reminder_setting.split(",")
-                reminder_minutes_list = []
-
-                for time_str in reminder_times_str:
-                    time_str = time_str.strip()
-                    if not time_str:
-                        continue
-                    minutes = int(time_str)
-                    if minutes <= 0:
-                        await update.message.reply_text(EDIT_REMINDERS_NEGATIVE_TIME)
-                        return
-                    reminder_minutes_list.append(minutes)
-
-                if not reminder_minutes_list:
-                    await update.message.reply_text(EDIT_REMINDERS_NO_TIMES)
-                    return
-
-                success = database.update_task_reminders(
-                    task["id"], reminder_minutes_list=reminder_minutes_list
-                )
-                if success:
-                    if len(reminder_minutes_list) == 1:
-                        minutes = reminder_minutes_list[0]
-                        if minutes == 60:
-                            time_str = TIME_1_HOUR
-                        elif minutes == 30:
-                            time_str = TIME_30_MINUTES
-                        else:
-                            time_str = f"{minutes} minutes"
-                        message = EDIT_REMINDERS_UPDATED_SINGLE.format(
-                            task_name=task["task_name"], time_str=time_str
-                        )
-                    else:
-                        reminder_parts = []
-                        for minutes in sorted(reminder_minutes_list):
-                            if minutes == 60:
-                                reminder_parts.append(TIME_1_HOUR)
-                            elif minutes == 30:
-                                reminder_parts.append(TIME_30_MINUTES)
-                            else:
-                                reminder_parts.append(f"{minutes} minutes")
-                        message = EDIT_REMINDERS_UPDATED_MULTIPLE.format(
-                            task_name=task["task_name"],
-                            reminder_parts=", ".join(reminder_parts),
-                        )
-
-                    await update.message.reply_text(message, parse_mode="HTML")
-                    logger.info(
-                        f"User {user.id} updated reminders for task {task['id']} to {reminder_minutes_list}"
-                    )
-                else:
-                    await update.message.reply_text(EDIT_REMINDERS_ERROR)
-            except ValueError:
+            # One regex pass validates the whole comma-separated list up
+            # front, so the int() conversions below cannot fail
+            if _REMINDER_LIST_RE.fullmatch(reminder_setting) is None:
                 await update.message.reply_text(EDIT_REMINDERS_INVALID_TIMES)
+                return
+
+            reminder_minutes_list = [int(p) for p in reminder_setting.split(",")]
+
+            if any(minutes <= 0 for minutes in reminder_minutes_list):
+                await update.message.reply_text(EDIT_REMINDERS_NEGATIVE_TIME)
+                return
+
+            success = await asyncio.to_thread(
+                database.update_task_reminders,
+                task["id"], reminder_minutes_list=reminder_minutes_list
+            )
+            if success:
+                labels = _format_reminder_list(reminder_minutes_list)
+                seg = (
+                    EDIT_REMINDERS_UPDATED_SINGLE_SEGMENTS
+                    if len(reminder_minutes_list) == 1
+                    else EDIT_REMINDERS_UPDATED_MULTIPLE_SEGMENTS
+                )
+                message = "".join((seg[0], task["task_name"], seg[1], labels, seg[2]))
+
+                await update.message.reply_text(message)
+                logger.info(
+                    "User %s updated reminders for task %s to %s",
+                    user.id,
+                    task["id"],
+                    reminder_minutes_list,
+                )
+            else:
+                await update.message.reply_text(EDIT_REMINDERS_ERROR)
 
     except ValueError:
         await update.message.reply_text(EDIT_REMINDERS_INVALID_NUMBER)
@@ -648,73 +859,62 @@ async def update_task_status_command(
     user = update.effective_user
 
     if not context.args or len(context.args) < 2:
-        await update.message.reply_text(
-            "Update Task Status\n\n"
-            "Usage: /update_status TASK_CODE STATUS\n\n"
-            "Available statuses:\n"
-            "• new - Task is new\n"
-            "• in_progress or progress - Task is in progress\n"
-            "• done - Task is completed\n\n"
-            "Example: /update_status TK0001 in_progress",
-            parse_mode="HTML",
-        )
+        await update.message.reply_text(UPDATE_STATUS_USAGE)
         return
 
     task_code = context.args[0].upper()
     status_input = context.args[1].lower()
 
     # Map input to TaskStatus
-    from models import TaskStatus
-
-    status_map = {
-        "new": TaskStatus.NEW,
-        "in_progress": TaskStatus.IN_PROGRESS,
-        "progress": TaskStatus.IN_PROGRESS,
-        "done": TaskStatus.DONE,
-        "complete": TaskStatus.DONE,
-        "completed": TaskStatus.DONE,
-    }
+    status_map = _STATUS_MAP
 
     if status_input not in status_map:
         await update.message.reply_text(
             f"Invalid status: {status_input}\n\n"
             "Valid options: new, in_progress, done",
-            parse_mode="HTML",
         )
         return
 
     new_status = status_map[status_input]
 
+    # Reject malformed codes before paying for a DB roundtrip
+    if _TASK_CODE_RE.match(task_code) is None:
+        await update.message.reply_text(
+            f"Task {task_code} not found.",
+        )
+        return
+
     # Get task to verify it exists and user has access
-    task = database.get_task_by_code(task_code)
+    task = await asyncio.to_thread(database.get_task_by_code, task_code)
 
     if not task:
         await update.message.reply_text(
             f"Task {task_code} not found.",
-            parse_mode="HTML",
         )
         return
 
     # Update status
-    success = database.update_task_status(task["id"], new_status)
+    success = await asyncio.to_thread(
+        database.update_task_status, task["id"], new_status
+    )
 
     if success:
         await update.message.reply_text(
             f"Status Updated!\n\n"
             f"Task: <b>{task['task_name']}</b> ({task_code})\n"
             f"New status: <b>{new_status.value.replace('_', ' ').title()}</b>",
-            parse_mode="HTML",
+            parse_mode=ParseMode.HTML,
         )
         logger.info(
-            f"User {user.id} updated task {task_code} status to {new_status.value}"
+            "User %s updated task %s status to %s", user.id, task_code, new_status.value
         )
     else:
         await update.message.reply_text(
             "Failed to update task status.",
-            parse_mode="HTML",
         )
 
 
+@admin_only("Only group admins can view other users' done tasks.")
 async def view_done_tasks_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE, database
 ):
@@ -722,90 +922,86 @@ async def view_done_tasks_command(
     user = update.effective_user
     chat = update.effective_chat
 
-    # Only works in groups
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        await update.message.reply_text("⚠️ This command only works in group chats.")
-        return
-
-    # Check if user is admin
-    member = await chat.get_member(user.id)
-    if member.status not in ["creator", "administrator"]:
-        await update.message.reply_text(
-            "Only group admins can view other users' done tasks."
-        )
-        return
-
     # Check if a user was mentioned
     mentioned_user_id = None
     mentioned_user_name = None
 
-    # Check for text mentions
+    # Let parse_entities filter down to mention entities (the type
+    # compare happens in the library) and take the first hit, so the
+    # common case costs O(1) and at most one DB lookup follows
     if update.message.entities:
-        for entity in update.message.entities:
-            if entity.type == "text_mention" and entity.user:
+        mention = next(
+            iter(
+                update.message.parse_entities(
+                    types=[MessageEntity.TEXT_MENTION, MessageEntity.MENTION]
+                ).items()
+            ),
+            None,
+        )
+        if mention is not None:
+            entity, entity_text = mention
+            if entity.type == MessageEntity.TEXT_MENTION and entity.user:
                 mentioned_user_id = entity.user.id
                 mentioned_user_name = entity.user.first_name
                 if entity.user.last_name:
                     mentioned_user_name += f" {entity.user.last_name}"
-                break
-            elif entity.type == "mention":
-                # Extract @username
-                username_text = update.message.text[
-                    entity.offset : entity.offset + entity.length
-                ]
-                clean_username = username_text.lstrip("@")
+            elif entity.type == MessageEntity.MENTION:
+                clean_username = entity_text.lstrip("@")
 
-                # Look up user by username
-                user_id = database.get_user_by_username(clean_username)
-                if user_id:
-                    mentioned_user_id = user_id
-                    user_info = database.get_user_by_telegram_id(user_id)
-                    if user_info:
-                        if user_info.get("username"):
-                            mentioned_user_name = f"@{user_info['username']}"
-                        else:
-                            mentioned_user_name = user_info.get("first_name", "User")
-                            if user_info.get("last_name"):
-                                mentioned_user_name += f" {user_info['last_name']}"
-                    break
+                # Look up user by username - one query for id and name
+                user_info = await asyncio.to_thread(
+                    database.get_user_by_username_full, clean_username
+                )
+                if user_info:
+                    mentioned_user_id = user_info["telegram_id"]
+                    if user_info.get("username"):
+                        mentioned_user_name = f"@{user_info['username']}"
+                    else:
+                        mentioned_user_name = user_info.get("first_name", "User")
+                        if user_info.get("last_name"):
+                            mentioned_user_name += f" {user_info['last_name']}"
 
     if not mentioned_user_id:
-        await update.message.reply_text(
-            "View Done Tasks\n\n"
-            "Usage: /view_done @username or tap on user's name\n\n"
-            "This will show all completed tasks for that user in this group.",
-            parse_mode="HTML",
-        )
+        await update.message.reply_text(VIEW_DONE_USAGE)
         return
 
     # Get done tasks for the user in this chat
-    done_tasks = database.get_done_tasks_for_user_in_chat(mentioned_user_id, chat.id)
+    done_tasks = await asyncio.to_thread(
+        database.get_done_tasks_for_user_in_chat, mentioned_user_id, chat.id
+    )
 
     if not done_tasks:
         await update.message.reply_text(
             f"No completed tasks found for {mentioned_user_name} in this group.",
-            parse_mode="HTML",
         )
         return
 
-    # Build response
-    response = f"Completed Tasks for {html.escape(mentioned_user_name)}\n\n"
+    # Build the response in a list and join once - repeated += on a string
+    # copies the whole buffer every iteration
+    parts = [f"Completed Tasks for {_esc(mentioned_user_name)}\n\n"]
+
+    # Local alias keeps the loop from re-resolving the global per task
+    _escape = _esc
 
     for task in done_tasks:
         due_date_str = task["due_date"].strftime(DATE_FORMAT)
 
-        response += (
-            f"<b>{task['task_code']}</b> - {html.escape(task['task_name'])}\n"
+        parts.append(
+            f"<b>{task['task_code']}</b> - {_escape(task['task_name'])}\n"
             f"   Due: {due_date_str}\n"
             f"   Created: {task['created_at'].strftime(DATE_FORMAT)}\n\n"
         )
 
-    await update.message.reply_text(response, parse_mode="HTML")
+    await update.message.reply_text("".join(parts), parse_mode=ParseMode.HTML)
     logger.info(
-        f"Admin {user.id} viewed done tasks for user {mentioned_user_id} in chat {chat.id}"
+        "Admin %s viewed done tasks for user %s in chat %s",
+        user.id,
+        mentioned_user_id,
+        chat.id,
     )
 
 
+@admin_only("Only group admins can delete tasks.")
 async def delete_task_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE, database
 ):
@@ -813,57 +1009,37 @@ async def delete_task_command(
     user = update.effective_user
     chat = update.effective_chat
 
-    # Only works in groups
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        await update.message.reply_text("⚠️ This command only works in group chats.")
-        return
-
-    # Check if user is admin
-    member = await chat.get_member(user.id)
-    if member.status not in ["creator", "administrator"]:
-        await update.message.reply_text("Only group admins can delete tasks.")
-        return
-
     if not context.args:
-        await update.message.reply_text(
-            "<b>Delete Tasks</b>\n\n"
-            "Usage: /delete_task TASK_CODE [TASK_CODE2] ...\n\n"
-            "Examples:\n"
-            "• /delete_task TK0001\n"
-            "• /delete_task TK0001 TK0002 TK0003\n"
-            "• /delete_task TK0001,TK0002\n\n"
-            "Warning: This action cannot be undone!",
-            parse_mode="HTML",
-        )
+        await update.message.reply_text(DELETE_TASK_USAGE, parse_mode=ParseMode.HTML)
         return
 
-    # Parse task codes - handle both space-separated and comma-separated
-    task_codes_input = " ".join(context.args)
-    # Split by comma first, then by space for each part
-    task_codes = []
-    for part in task_codes_input.split(","):
-        task_codes.extend(
-            [code.strip().upper() for code in part.split() if code.strip()]
+    # One finditer pass pulls code-shaped tokens out of the argument
+    # string, rejecting noise up front; dict.fromkeys dedupes in order
+    task_codes = list(
+        dict.fromkeys(
+            m.group(0).upper() for m in _CODE_FINDER.finditer(" ".join(context.args))
         )
-
-    # Remove duplicates while preserving order
-    seen = set()
-    task_codes = [x for x in task_codes if not (x in seen or seen.add(x))]
+    )
 
     if not task_codes:
         await update.message.reply_text(
             "No valid task codes provided.",
-            parse_mode="HTML",
         )
         return
 
-    # Validate and collect tasks
+    # Validate and collect tasks with a single IN (...) query instead of
+    # one lookup per code
+    found_tasks = {
+        task["task_code"]: task
+        for task in await asyncio.to_thread(database.get_tasks_by_codes, task_codes)
+    }
+
     valid_tasks = []
     invalid_codes = []
     wrong_chat_codes = []
 
     for task_code in task_codes:
-        task = database.get_task_by_code(task_code)
+        task = found_tasks.get(task_code)
 
         if not task:
             invalid_codes.append(task_code)
@@ -876,67 +1052,71 @@ async def delete_task_command(
 
         valid_tasks.append(task)
 
-    # Report issues
+    # Delete valid tasks in one transaction
+    deleted_ids = set(
+        await asyncio.to_thread(
+            database.delete_tasks, [task["id"] for task in valid_tasks]
+        )
+    )
+    deleted_tasks = [task for task in valid_tasks if task["id"] in deleted_ids]
+    failed_deletions = [
+        task["task_code"] for task in valid_tasks if task["id"] not in deleted_ids
+    ]
+
+    # Report everything in one message instead of up to four Bot API calls
+    sections = []
+    _escape = _esc
+
     if invalid_codes:
-        await update.message.reply_text(
-            f"The following task codes were not found: {', '.join(invalid_codes)}",
-            parse_mode="HTML",
+        sections.append(
+            f"The following task codes were not found: {', '.join(invalid_codes)}"
         )
 
     if wrong_chat_codes:
-        await update.message.reply_text(
-            f"The following tasks are not from this group: {', '.join(wrong_chat_codes)}",
-            parse_mode="HTML",
+        sections.append(
+            f"The following tasks are not from this group: {', '.join(wrong_chat_codes)}"
         )
 
-    if not valid_tasks:
-        return
-
-    # Delete valid tasks
-    deleted_tasks = []
-    failed_deletions = []
-
-    for task in valid_tasks:
-        success = database.delete_task(task["id"])
-        if success:
-            deleted_tasks.append(task)
-        else:
-            failed_deletions.append(task["task_code"])
-
-    # Report results
     if deleted_tasks:
         if len(deleted_tasks) == 1:
             task = deleted_tasks[0]
-            await update.message.reply_text(
+            sections.append(
                 f"Task Deleted!\n\n"
-                f"Task {task['task_code']} - {html.escape(task['task_name'])} has been permanently deleted.\n\n"
-                f"Tip: Use /my_tasks to view remaining tasks.",
-                parse_mode="HTML",
+                f"Task {task['task_code']} - {_escape(task['task_name'])} has been permanently deleted.\n\n"
+                f"Tip: Use /my_tasks to view remaining tasks."
             )
         else:
             task_list = "\n".join(
                 [
-                    f"• <code>{task['task_code']}</code> - {html.escape(task['task_name'])}"
+                    f"• <code>{task['task_code']}</code> - {_escape(task['task_name'])}"
                     for task in deleted_tasks
                 ]
             )
-            await update.message.reply_text(
+            sections.append(
                 f"{len(deleted_tasks)} Tasks Deleted!\n\n"
                 f"The following tasks have been permanently deleted:\n{task_list}\n\n"
-                f"Tip: Use /my_tasks to view remaining tasks.",
-                parse_mode="HTML",
+                f"Tip: Use /my_tasks to view remaining tasks."
             )
         logger.info(
-            f"Admin {user.id} deleted {len(deleted_tasks)} tasks in chat {chat.id}: {[t['task_code'] for t in deleted_tasks]}"
+            "Admin %s deleted %s tasks in chat %s: %s",
+            user.id,
+            len(deleted_tasks),
+            chat.id,
+            [t["task_code"] for t in deleted_tasks],
         )
 
     if failed_deletions:
+        sections.append(
+            f"Failed to delete the following tasks: {', '.join(failed_deletions)}"
+        )
+
+    if sections:
         await update.message.reply_text(
-            f"Failed to delete the following tasks: {', '.join(failed_deletions)}",
-            parse_mode="HTML",
+            "\n\n".join(sections), parse_mode=ParseMode.HTML
         )
 
 
+@admin_only("Only group admins can list tasks for other users.")
 async def list_tasks_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE, database
 ):
@@ -944,33 +1124,8 @@ async def list_tasks_command(
     user = update.effective_user
     chat = update.effective_chat
 
-    # Only works in groups
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        await update.message.reply_text("⚠️ This command only works in group chats.")
-        return
-
-    # Check if user is admin
-    member = await chat.get_member(user.id)
-    if member.status not in ["creator", "administrator"]:
-        await update.message.reply_text(
-            "Only group admins can list tasks for other users."
-        )
-        return
-
     if not context.args:
-        await update.message.reply_text(
-            "<b>List Tasks</b>\n\n"
-            "Usage: /list_tasks @username [status]\n\n"
-            "Mandatory: @username (or mention the user)\n"
-            "Optional status filters:\n"
-            "• new - Only new tasks\n"
-            "• in_progress - Only tasks in progress\n"
-            "• done - Only completed tasks\n"
-            "• all - All tasks (default)\n\n"
-            "Example: /list_tasks @john done\n\n"
-            "Tip: Admins can list tasks for any user.",
-            parse_mode="HTML",
-        )
+        await update.message.reply_text(LIST_TASKS_USAGE, parse_mode=ParseMode.HTML)
         return
 
     # Parse arguments
@@ -978,57 +1133,67 @@ async def list_tasks_command(
     mentioned_user_id = None
     mentioned_user_name = None
 
-    # Check for text mentions
+    # Check for text mentions. Pick the first mention entity in a pure
+    # Python scan, then resolve it with at most one DB lookup - keeping
+    # the query inside the entity loop risked one round-trip per entity
     if update.message.entities:
-        for entity in update.message.entities:
-            if entity.type == "text_mention" and entity.user:
+        entity = next(
+            (
+                e
+                for e in update.message.entities
+                if (e.type == "text_mention" and e.user) or e.type == "mention"
+            ),
+            None,
+        )
+        if entity is not None:
+            if entity.type == "text_mention":
                 mentioned_user_id = entity.user.id
                 mentioned_user_name = entity.user.first_name
                 if entity.user.last_name:
                     mentioned_user_name += f" {entity.user.last_name}"
-                break
-            elif entity.type == "mention":
+            else:
                 # Extract @username
                 username_text = update.message.text[
                     entity.offset : entity.offset + entity.length
                 ]
                 clean_username = username_text.lstrip("@")
 
-                # Look up user by username
-                user_id = database.get_user_by_username(clean_username)
-                if user_id:
-                    mentioned_user_id = user_id
-                    user_info = database.get_user_by_telegram_id(user_id)
-                    if user_info:
-                        if user_info.get("username"):
-                            mentioned_user_name = f"@{user_info['username']}"
-                        else:
-                            mentioned_user_name = user_info.get("first_name", "User")
-                            if user_info.get("last_name"):
-                                mentioned_user_name += f" {user_info['last_name']}"
-                    break
-
-    # If no mention found in entities, check args
-    if not mentioned_user_id and context.args:
-        first_arg = context.args[0]
-        if first_arg.startswith("@"):
-            clean_username = first_arg.lstrip("@")
-            user_id = database.get_user_by_username(clean_username)
-            if user_id:
-                mentioned_user_id = user_id
-                user_info = database.get_user_by_telegram_id(user_id)
+                # Look up user by username - one query for id and name
+                user_info = await asyncio.to_thread(
+                    database.get_user_by_username_full, clean_username
+                )
                 if user_info:
+                    mentioned_user_id = user_info["telegram_id"]
                     if user_info.get("username"):
                         mentioned_user_name = f"@{user_info['username']}"
                     else:
                         mentioned_user_name = user_info.get("first_name", "User")
                         if user_info.get("last_name"):
                             mentioned_user_name += f" {user_info['last_name']}"
+
+    # If no mention found in entities, check args
+    if not mentioned_user_id and context.args:
+        first_arg = context.args[0]
+        if first_arg.startswith("@"):
+            clean_username = first_arg.lstrip("@")
+            user_info = await asyncio.to_thread(
+                database.get_user_by_username_full, clean_username
+            )
+            if user_info:
+                mentioned_user_id = user_info["telegram_id"]
+                if user_info.get("username"):
+                    mentioned_user_name = f"@{user_info['username']}"
+                else:
+                    mentioned_user_name = user_info.get("first_name", "User")
+                    if user_info.get("last_name"):
+                        mentioned_user_name += f" {user_info['last_name']}"
         else:
             # Check if the first argument is a valid user ID
             try:
                 user_id = int(first_arg)
-                user_info = database.get_user_by_telegram_id(user_id)
+                user_info = await asyncio.to_thread(
+                    database.get_user_by_telegram_id, user_id
+                )
                 if user_info:
                     mentioned_user_id = user_id
                     if user_info.get("username"):
@@ -1042,81 +1207,76 @@ async def list_tasks_command(
 
     # If still no mention, respond with usage
     if not mentioned_user_id:
-        await update.message.reply_text(
-            "<b>List Tasks</b>\n\n"
-            "Usage: /list_tasks @username [status]\n\n"
-            "Mandatory: @username (or mention the user)\n"
-            "Optional status filters:\n"
-            "• new - Only new tasks\n"
-            "• in_progress - Only tasks in progress\n"
-            "• done - Only completed tasks\n"
-            "• all - All tasks (default)\n\n"
-            "Example: /list_tasks @john done\n\n"
-            "Tip: Admins can list tasks for any user.",
-            parse_mode="HTML",
-        )
+        await update.message.reply_text(LIST_TASKS_USAGE, parse_mode=ParseMode.HTML)
         return
 
     # Check if a specific status filter is requested
     if len(context.args) > 1:
         second_arg = context.args[1].lower()
-        if second_arg in ["new", "in_progress", "done", "all"]:
+        if second_arg in _MY_TASKS_FILTERS:
             if second_arg != "all":
                 status_filter = second_arg.upper()
         else:
             status_filter = None  # Invalid status, show all tasks
 
-    # Get all tasks for the user in this chat
-    all_tasks = database.get_user_tasks(mentioned_user_id)
-
-    # Filter by group if in a group chat
-    if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        all_tasks = [task for task in all_tasks if task["chat_id"] == chat.id]
-
-    # Apply status filter if any
-    if status_filter:
-        all_tasks = [task for task in all_tasks if task.get("status") == status_filter]
+    # Get all tasks for the user in this chat; both filters are applied in
+    # the SQL WHERE clause
+    all_tasks = await asyncio.to_thread(
+        database.get_user_tasks,
+        mentioned_user_id,
+        chat_id=(
+            chat.id if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP] else None
+        ),
+        status=status_filter,
+    )
 
     if not all_tasks:
         await update.message.reply_text(f"No tasks found for {mentioned_user_name}.")
         return
 
-    # Status name mapping
-    status_names = {"NEW": "New", "IN_PROGRESS": "In Progress", "DONE": "Done"}
+    status_names = _STATUS_NAMES
 
     filter_text = (
         f" ({status_names.get(status_filter, 'All').lower()})" if status_filter else ""
     )
 
-    # Build response
-    response = f"<b>Tasks for {html.escape(mentioned_user_name)}{filter_text}:</b>\n\n"
+    # Build the response in a list and join once - repeated += on a string
+    # copies the whole buffer every iteration
+    parts = [f"<b>Tasks for {_esc(mentioned_user_name)}{filter_text}:</b>\n\n"]
+
+    # One clock read for the whole listing, so every task renders against
+    # the same instant; bind the hot lookups to locals while we are at it
+    now = datetime.now(timezone.utc)
+    _status_get = status_names.get
+    _fmt = DATE_FORMAT
 
     for task in all_tasks:
-        due_date_str = task["due_date"].strftime(DATE_FORMAT)
+        due_date_str = task["due_date"].strftime(_fmt)
 
         if task["due_date"].tzinfo is None:
             due_date_utc = task["due_date"].replace(tzinfo=timezone.utc)
         else:
             due_date_utc = task["due_date"]
 
-        time_remaining = due_date_utc - datetime.now(timezone.utc)
+        time_remaining = due_date_utc - now
         days = time_remaining.days
-        hours = time_remaining.seconds // 3600
+        # One divmod reads .seconds once and yields both fields
+        hours, rem = divmod(time_remaining.seconds, 3600)
+        minutes = rem // 60
 
         if days > 0:
             time_str = f"{days} day(s) {hours} hour(s)"
         elif hours > 0:
             time_str = f"{hours} hour(s)"
         else:
-            minutes = time_remaining.seconds // 60
             time_str = f"{minutes} minute(s)"
 
-        # Get status display
-        task_status = task.get("status", "NEW")
-        status_display = status_names.get(task_status, "New")
+        # Get status display; the DAO always populates these keys, so
+        # plain indexing beats .get() with a default
+        status_display = _status_get(task["status"], "New")
 
         # Get assignees display
-        assignees = task.get("assignees", [])
+        assignees = task["assignees"]
         if assignees:
             assignee_names = []
             for assignee in assignees:
@@ -1129,7 +1289,7 @@ async def list_tasks_command(
         else:
             assignees_str = "None"
 
-        response += (
+        parts.append(
             f"<b>{task['task_code']}</b> - {task['task_name']}\n"
             f"   Status: <b>{status_display}</b>\n"
             f"   Assigned to: {assignees_str}\n"
@@ -1139,9 +1299,12 @@ async def list_tasks_command(
 
     # Add filter hint if no filter is applied
     if not status_filter:
-        response += "\nTip: Use /my_tasks [new|in_progress|done] to filter tasks"
+        parts.append("\nTip: Use /my_tasks [new|in_progress|done] to filter tasks")
 
-    await update.message.reply_text(response, parse_mode="HTML")
+    await update.message.reply_text("".join(parts), parse_mode=ParseMode.HTML)
     logger.info(
-        f"Admin {user.id} listed tasks for user {mentioned_user_id} (filter: {status_filter or 'all'})"
+        "Admin %s listed tasks for user %s (filter: %s)",
+        user.id,
+        mentioned_user_id,
+        status_filter or "all",
     )
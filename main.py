@@ -1,8 +1,7 @@
 import os
+import asyncio
 import logging
 import uvicorn
-from fastapi import FastAPI
-from api import app as fastapi_app
 from bot import TaskBot
 
 logging.basicConfig(
@@ -33,46 +32,60 @@ def run_webhook():
         "curl -X POST https://api.telegram.org/bot<YOUR_BOT_TOKEN>/setWebhook?url=<YOUR_PUBLIC_URL>/webhook/<BOT_ID>"
     )
 
-    # Run FastAPI with Uvicorn
+    # Run FastAPI with Uvicorn. The auto-reloader is a development
+    # feature (extra supervisor process plus file-watch overhead), so it
+    # is off unless UVICORN_RELOAD=1 is exported
     uvicorn.run(
-        "api:app", host="0.0.0.0", port=int(os.getenv("PORT", 8000)), reload=True
+        "api:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8000)),
+        reload=bool(int(os.getenv("UVICORN_RELOAD", "0"))),
+        workers=int(os.getenv("UVICORN_WORKERS", "1")),
     )
 
 
 def run_combined():
-    """Run both FastAPI API and bot in polling mode"""
-    logger.info("Starting combined mode: API + Polling bot...")
+    """Run the FastAPI API and the polling bot in one process.
 
-    # Import here to avoid circular imports
-    from multiprocessing import Process
-    import time
-
-    # Function to run polling bot
-    def run_bot():
-        token = os.getenv("TELEGRAM_BOT_TOKEN")
-        if token:
-            bot = TaskBot(token)
-            bot.run()
-        else:
-            logger.error("TELEGRAM_BOT_TOKEN not set for polling mode")
-
-    # Start bot in separate process
-    bot_process = Process(target=run_bot)
-    bot_process.start()
+    uvicorn.Server.serve() is a coroutine, so the API and the bot share
+    one event loop, one DB pool and one Telegram HTTP pool instead of
+    forking a second interpreter and sleeping until it comes up.
+    """
+    logger.info("Starting combined mode: API + Polling bot...")
 
-    # Give bot time to start
-    time.sleep(2)
+    import bot as bot_module
 
-    # Run FastAPI
-    uvicorn.run(
-        "api:app",
-        host="0.0.0.0",
-        port=int(os.getenv("PORT", 8000)),
-        reload=False,  # Disable reload in combined mode
-    )
+    if not bot_module.bot_instance:
+        logger.error("TELEGRAM_BOT_TOKEN not set for polling mode")
+        return
 
-    # Wait for bot process
-    bot_process.join()
+    async def _serve():
+        config = uvicorn.Config(
+            "bot:app",
+            host="0.0.0.0",
+            port=int(os.getenv("PORT", 8000)),
+            reload=False,
+        )
+        server = uvicorn.Server(config)
+
+        async def _start_polling():
+            # The app lifespan initializes the bot; begin polling as
+            # soon as that has happened
+            while not bot_module.bot_instance.initialized:
+                await asyncio.sleep(0.5)
+            await bot_module.bot_instance.application.updater.start_polling()
+            logger.info("Polling started alongside the API")
+
+        polling = asyncio.create_task(_start_polling())
+        try:
+            await server.serve()
+        finally:
+            polling.cancel()
+            updater = bot_module.bot_instance.application.updater
+            if updater and updater.running:
+                await updater.stop()
+
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":
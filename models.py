@@ -10,7 +10,9 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     BigInteger,
-    Enum,
+    CheckConstraint,
+    Index,
+    text,
 )
 import enum
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
@@ -64,7 +66,21 @@ if DATABASE_URL:
 
 # Create SQLAlchemy engine
 try:
-    engine = create_engine(DATABASE_URL, connect_args=connect_args)
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args=connect_args,
+        # Batch multi-row INSERT/UPDATE statements (bulk user upserts etc.)
+        # instead of one psycopg2 round-trip per row
+        executemany_mode="values_plus_batch",
+        # Keep enough pooled connections for bot handlers, scheduler and
+        # API to share, and drop dead ones before handing them out.
+        # Recycling well under typical cloud idle timeouts avoids the
+        # first-request-after-idle connection resets
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_POOL_OVERFLOW", "20")),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
 except Exception as e:
     print(f"❌ Failed to create engine with URL: {DATABASE_URL.split('@')[-1] if DATABASE_URL else 'None'}")
     raise e
@@ -76,8 +92,9 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
-# Task status enum
-class TaskStatus(enum.Enum):
+# Task status enum. The str mixin lets members compare equal to the plain
+# strings stored in the status column
+class TaskStatus(str, enum.Enum):
     NEW = "NEW"
     IN_PROGRESS = "IN_PROGRESS"
     DONE = "DONE"
@@ -156,7 +173,9 @@ class Task(Base):
     description = Column(String, nullable=True)
     chat_id = Column(BigInteger, nullable=False)
     due_date = Column(DateTime(timezone=True), nullable=False)
-    status = Column(Enum(TaskStatus), default=TaskStatus.NEW, nullable=False)
+    # Plain VARCHAR + CHECK instead of a native enum type: no per-row value
+    # conversion on fetch and no ALTER TYPE dance when states change
+    status = Column(String(20), default=TaskStatus.NEW.value, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed = Column(Boolean, default=False)  # Keep for backward compatibility
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
@@ -171,8 +190,18 @@ class Task(Base):
     assignee = relationship("Member", back_populates="tasks")
     workspace = relationship("Workspace")
 
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('NEW', 'IN_PROGRESS', 'DONE')", name="tasks_status_check"
+        ),
+        # Per-chat listings and the scheduler's due-date window both filter
+        # on these columns on every poll
+        Index("ix_tasks_chat_id", "chat_id"),
+        Index("ix_tasks_due_date", "due_date"),
+    )
+
     def __str__(self):
-        return f"Task(id={self.id}, code={self.task_code}, name={self.task_name}, status={self.status.value}, due={self.due_date})"
+        return f"Task(id={self.id}, code={self.task_code}, name={self.task_name}, status={self.status}, due={self.due_date})"
 
 
 class TaskAssignment(Base):
@@ -201,6 +230,20 @@ class Reminder(Base):
     # Relationships
     task = relationship("Task", back_populates="reminders")
 
+    __table_args__ = (
+        # Partial index keeps the scheduler's unsent-reminder scan off the
+        # ever-growing pile of already-sent rows
+        Index(
+            "ix_reminders_pending",
+            "sent",
+            "task_id",
+            postgresql_where=text("sent = false"),
+        ),
+        # A task gets at most one reminder row per offset, so an edit can
+        # never leave duplicates that would double-notify
+        Index("uq_reminders_task_offset", "task_id", "minutes_before", unique=True),
+    )
+
     def __str__(self):
         return f"Reminder(id={self.id}, task_id={self.task_id}, minutes_before={self.minutes_before}, sent={self.sent})"
 
@@ -282,7 +325,20 @@ def migrate_task_status():
                 conn.commit()
             else:
                 print("Status column already exists. Skipping raw string migration.")
-                
+
+            # Convert a native enum status column (older deployments) to
+            # plain VARCHAR so fetches skip the per-row enum conversion
+            type_check = conn.execute(
+                text("SELECT udt_name FROM information_schema.columns WHERE table_name='tasks' AND column_name='status'")
+            ).fetchone()
+            if type_check and type_check[0] not in ("varchar", "text"):
+                print("Converting status column to VARCHAR...")
+                conn.execute(text("ALTER TABLE tasks ALTER COLUMN status DROP DEFAULT"))
+                conn.execute(text("ALTER TABLE tasks ALTER COLUMN status TYPE VARCHAR(20) USING status::text"))
+                conn.execute(text("ALTER TABLE tasks ALTER COLUMN status SET DEFAULT 'NEW'"))
+                conn.commit()
+
+
             # NEW: Add workspace_id migration here too
             ws_check = conn.execute(
                 text("SELECT column_name FROM information_schema.columns WHERE table_name='tasks' AND column_name='workspace_id'")
@@ -352,3 +408,27 @@ def migrate_dashboard_schema():
             print("Dashboard schema migrated successfully")
     except Exception as e:
         print(f"Dashboard schema migration failed: {e}")
+
+def migrate_indexes():
+    """Create hot-path indexes on existing tasks/reminders tables"""
+    from sqlalchemy import text
+
+    statements = [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_chat_id ON tasks (chat_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_due_date ON tasks (due_date)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reminders_pending ON reminders (sent, task_id) WHERE sent = false",
+        # Fails harmlessly (caught below) if historical duplicates exist;
+        # clean those up first, then rerun
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_reminders_task_offset ON reminders (task_id, minutes_before)",
+    ]
+    try:
+        # CONCURRENTLY cannot run inside a transaction block, so build the
+        # indexes on an autocommit connection without blocking writers
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+        print("Hot-path indexes in place")
+    except Exception as e:
+        print(f"Index migration failed: {e}")
@@ -1,33 +1,75 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import lru_cache
 from telegram import Bot
+import asyncio
 import logging
 
 from constants import (
-    DATE_FORMAT,
     SCHEDULER_INTERVAL_MINUTES,
     TIME_1_HOUR,
     TIME_30_MINUTES,
-    REMINDER_MESSAGE,
+    REMINDER_MESSAGE_SEGMENTS,
+    format_date,
 )
 
 logger = logging.getLogger(__name__)
 
+# Human-readable labels for the common reminder offsets; anything else
+# falls back to "N minutes"
+_TIME_STR = {
+    60: TIME_1_HOUR,
+    30: TIME_30_MINUTES,
+    120: "2 hours",
+    1440: "1 day",
+}
+
+
+@lru_cache(maxsize=4096)
+def _render_mention(username, first_name, last_name):
+    """Render one user's @mention, falling back to their display name.
+
+    Cached per identity tuple: a user appearing across many tasks and
+    reminder offsets pays the branch-and-concat work once.
+    """
+    if username:
+        return f"@{username}"
+    name = first_name or "User"
+    return f"{name} {last_name}" if last_name else name
+
+
+@lru_cache(maxsize=512)
+def _render_mentions(users_key):
+    """Join mention strings for a tuple of (username, first, last) triples.
+
+    A task reminded at several offsets renders the identical assignee list
+    each fire; the cache turns the repeats into one dict hit.
+    """
+    return ", ".join(_render_mention(*user) for user in users_key)
+
 
 class TaskScheduler:
     def __init__(self, bot: Bot, database):
         self.bot = bot
         self.database = database
         self.scheduler = AsyncIOScheduler()
+        # Caps concurrent sends below Telegram's ~30 msg/s bot limit
+        self._send_semaphore = asyncio.Semaphore(25)
 
     def start(self):
+        # A tick that overruns the interval (slow Telegram API, reminder
+        # burst) must not overlap with the next one, or both can pick up
+        # the same due rows before the sent flags flush
         self.scheduler.add_job(
             self.check_reminders,
             trigger=IntervalTrigger(minutes=SCHEDULER_INTERVAL_MINUTES),
             id="reminder_checker",
             name="Check for task reminders",
             replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=30,
         )
         self.scheduler.start()
         logger.info("Task scheduler started")
@@ -36,64 +78,141 @@ class TaskScheduler:
         try:
             now = datetime.now(timezone.utc)
 
-            pending_reminders = self.database.get_pending_reminders()
-
-            for reminder in pending_reminders:
-                task = reminder["task"]
-                if task["due_date"].tzinfo is None:
-                    due_date_utc = task["due_date"].replace(tzinfo=timezone.utc)
-                else:
-                    due_date_utc = task["due_date"]
-
-                reminder_time = due_date_utc - timedelta(
-                    minutes=reminder["minutes_before"]
+            # The one-minute due window is evaluated in SQL, so each tick
+            # fetches only the reminders actually firing now rather than
+            # every pending row filtered in Python
+            due_reminders = self.database.get_due_reminders(now)
+            if not due_reminders:
+                return
+
+            # Collapse duplicate rows for the same (task, offset) - e.g.
+            # an edit that left two identical reminders - so each fires as
+            # one message; the duplicates still get marked below
+            deduped = {}
+            for reminder in due_reminders:
+                deduped.setdefault(
+                    (reminder["task_id"], reminder["minutes_before"]), reminder
                 )
+            unique_reminders = list(deduped.values())
+
+            # Reminders firing in one tick often share a due date (daily
+            # standups, common deadlines); memoize the formatted string so
+            # strftime runs once per distinct datetime
+            due_date_cache = {}
+
+            # Bucket by chat: different chats overlap their Telegram
+            # round-trips, while sends within one chat stay sequential with
+            # a short gap to respect the ~1 msg/s per-chat limit. The
+            # shared semaphore still enforces the global cap
+            buckets = {}
+            for reminder in unique_reminders:
+                buckets.setdefault(reminder["task"]["chat_id"], []).append(reminder)
+
+            bucket_outcomes = await asyncio.gather(
+                *(
+                    self._drain_chat_bucket(bucket, due_date_cache)
+                    for bucket in buckets.values()
+                )
+            )
 
-                if reminder_time <= now < reminder_time + timedelta(minutes=1):
-                    await self.send_task_reminder(task, reminder["minutes_before"])
-                    self.database.mark_reminder_sent(reminder["id"])
-                    logger.info(
-                        f"Sent reminder for task {task['id']}: {task['task_name']} ({reminder['minutes_before']} minutes before)"
-                    )
+            # One UPDATE flips every successfully processed reminder,
+            # instead of a round-trip per send. Duplicates of a sent
+            # (task, offset) pair are marked too so they never re-fire
+            sent_keys = set()
+            for outcomes in bucket_outcomes:
+                for reminder, error in outcomes:
+                    if error is not None:
+                        logger.error(
+                            "Error processing reminder %s: %s",
+                            reminder["id"],
+                            error,
+                        )
+                    else:
+                        sent_keys.add(
+                            (reminder["task_id"], reminder["minutes_before"])
+                        )
+            sent_ids = [
+                reminder["id"]
+                for reminder in due_reminders
+                if (reminder["task_id"], reminder["minutes_before"]) in sent_keys
+            ]
+            self.database.mark_reminders_sent(sent_ids)
 
         except Exception as e:
-            logger.error(f"Error checking reminders: {e}", exc_info=True)
+            logger.error("Error checking reminders: %s", e, exc_info=True)
+
+    async def _drain_chat_bucket(self, reminders, due_date_cache):
+        """Send one chat's due reminders in order, pausing briefly between
+        sends; a failed send only affects its own reminder."""
+        outcomes = []
+        for i, reminder in enumerate(reminders):
+            if i:
+                await asyncio.sleep(0.05)
+            try:
+                await self._process_reminder(reminder, due_date_cache)
+            except Exception as e:
+                outcomes.append((reminder, e))
+            else:
+                outcomes.append((reminder, None))
+        return outcomes
+
+    async def _process_reminder(self, reminder, due_date_cache=None):
+        """Send one due reminder; marking happens in bulk per tick."""
+        task = reminder["task"]
+        async with self._send_semaphore:
+            await self.send_task_reminder(
+                task, reminder["minutes_before"], due_date_cache
+            )
+        logger.info(
+            "Sent reminder for task %s: %s (%s minutes before)",
+            task["id"],
+            task["task_name"],
+            reminder["minutes_before"],
+        )
 
-    async def send_task_reminder(self, task, reminder_minutes):
-        due_date_str = task["due_date"].strftime(DATE_FORMAT)
+    async def send_task_reminder(self, task, reminder_minutes, due_date_cache=None):
+        due_date = task["due_date"]
+        if due_date_cache is not None:
+            due_date_str = due_date_cache.get(due_date)
+            if due_date_str is None:
+                due_date_str = due_date_cache[due_date] = format_date(due_date)
+        else:
+            due_date_str = format_date(due_date)
 
         opted_in_users = [
             user for user in task["assigned_users"] if user["receive_reminders"]
         ]
 
         if not opted_in_users:
-            logger.info(f"No opted-in users for task {task['id']}")
+            logger.info("No opted-in users for task %s", task["id"])
             return
 
-        user_mentions = []
-        for user in opted_in_users:
-            if user["username"]:
-                user_mentions.append(f"@{user['username']}")
-            else:
-                # Try to get user info from Telegram if we don't have their username
-                display_name = user.get("first_name") or "User"
-                if user.get("last_name"):
-                    display_name += f" {user['last_name']}"
-                user_mentions.append(display_name)
-
-        if reminder_minutes == 60:
-            time_str = TIME_1_HOUR
-        elif reminder_minutes == 30:
-            time_str = TIME_30_MINUTES
-        else:
-            time_str = f"{reminder_minutes} minutes"
-
-        message = REMINDER_MESSAGE.format(
-            task_name=task["task_name"],
-            task_code=task["task_code"],
-            due_date_str=due_date_str,
-            user_mentions=", ".join(user_mentions),
-            time_str=time_str,
+        # Fall back to the display name for users without a username
+        user_mentions = _render_mentions(
+            tuple(
+                (user["username"], user.get("first_name"), user.get("last_name"))
+                for user in opted_in_users
+            )
+        )
+
+        time_str = _TIME_STR.get(reminder_minutes) or f"{reminder_minutes} minutes"
+
+        # Joining the pre-split segments skips .format's template parse
+        seg = REMINDER_MESSAGE_SEGMENTS
+        message = "".join(
+            (
+                seg[0],
+                task["task_name"],
+                seg[1],
+                task["task_code"],
+                seg[2],
+                due_date_str,
+                seg[3],
+                user_mentions,
+                seg[4],
+                time_str,
+                seg[5],
+            )
         )
 
         try:
@@ -101,11 +220,14 @@ class TaskScheduler:
                 chat_id=task["chat_id"], text=message, parse_mode="HTML"
             )
             logger.info(
-                f"Reminder sent to chat {task['chat_id']} for task: {task['task_name']} ({time_str})"
+                "Reminder sent to chat %s for task: %s (%s)",
+                task["chat_id"],
+                task["task_name"],
+                time_str,
             )
         except Exception as e:
             logger.error(
-                f"Failed to send reminder for task {task['id']}: {e}", exc_info=True
+                "Failed to send reminder for task %s: %s", task["id"], e, exc_info=True
             )
 
     def shutdown(self):
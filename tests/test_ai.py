@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Importing ai_parser pulls in google.genai; skip cleanly where the
+# optional dependency is not installed
+genai = pytest.importorskip("google.genai")
+
+requires_api_key = pytest.mark.skipif(
+    not os.getenv("GEMINI_API_KEY"),
+    reason="GEMINI_API_KEY not set",
+)
+
+
+@pytest.fixture(scope="session")
+def parser():
+    from ai_parser import TaskParser
+
+    return TaskParser()
+
+
+def test_parser_import():
+    from ai_parser import TaskParser  # noqa: F401
+
+
+@requires_api_key
+def test_parser_init(parser):
+    assert parser.client is not None
+
+
+@requires_api_key
+@pytest.mark.integration
+def test_parse_task(parser):
+    """Live Gemini round-trip; run explicitly with -m integration."""
+    test_users = [
+        {
+            "id": 123,
+            "username": "testuser",
+            "first_name": "Test",
+            "last_name": "User",
+        }
+    ]
+    result = parser.parse_task_description(
+        "Prepare presentation for @testuser in 7 days at 2 PM", test_users
+    )
+    assert result["task_name"]
+    assert "testuser" in result["usernames"]
+    assert result["due_date"]